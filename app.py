@@ -3,20 +3,24 @@ SEO Audit Tool - FastAPI Application
 Main application with routes and background task processing
 """
 from fastapi import FastAPI, Form, Request, BackgroundTasks, HTTPException
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 import uvicorn
 import uuid
 import os
 import asyncio
+import json
 import httpx
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
 from datetime import datetime
 from typing import Optional
 
-from database import Database, get_database
-from audit_engine import run_seo_audit
+from playwright.async_api import async_playwright
+
+from database import Database, EventBatch, Report, get_database
+from audit_engine import run_seo_audit, BROWSER_LAUNCH_ARGS
 from scoring import calculate_seo_score
 from report_generator import generate_pdf_report
 
@@ -42,7 +46,8 @@ os.makedirs(DRAFT_STORAGE_PATH, exist_ok=True)
 app = FastAPI(
     title="SEO Audit Tool",
     description="Automated SEO audit reports for Level Play Digital",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Mount static files
@@ -54,17 +59,42 @@ templates = Jinja2Templates(directory="templates")
 # Database
 db: Optional[Database] = None
 
-# Semaphore for concurrent audit limiting
-audit_semaphore = asyncio.Semaphore(MAX_CONCURRENT_AUDITS)
-
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup"""
+    """Initialize database and shared browser on startup"""
     global db
     db = get_database(DATABASE_PATH, SECRET_KEY)
     await db.initialize()
 
+    # Launch one shared browser for all audits (each audit gets its own context)
+    app.state.playwright = await async_playwright().start()
+    app.state.browser = await app.state.playwright.chromium.launch(
+        headless=True,
+        args=BROWSER_LAUNCH_ARGS
+    )
+
+    # Shared HTTP client - keep-alive pool reused by audits and webhooks
+    app.state.http = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        follow_redirects=True,
+        timeout=5.0
+    )
+
+    # SSE subscribers per in-flight report uuid
+    app.state.watchers = {}
+
+    # PDF rendering is CPU-bound; keep it off the event loop in worker processes
+    app.state.pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+    # Fixed-size worker pool consuming from a bounded queue - memory stays
+    # O(pool size) no matter how many submissions pile up
+    app.state.audit_queue = asyncio.Queue(maxsize=1000)
+    app.state.audit_workers = [
+        asyncio.create_task(audit_worker(app.state.audit_queue))
+        for _ in range(MAX_CONCURRENT_AUDITS)
+    ]
+
     # Schedule cleanup task
     asyncio.create_task(periodic_cleanup())
 
@@ -72,7 +102,33 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
-    pass
+    for worker in app.state.audit_workers:
+        worker.cancel()
+    app.state.pdf_pool.shutdown(wait=False)
+    await app.state.http.aclose()
+    await app.state.browser.close()
+    await app.state.playwright.stop()
+    await db.close()
+
+
+def notify_watchers(report_uuid: str, status: str, error_message: Optional[str] = None):
+    """Push a status transition to any SSE subscribers for this report"""
+    for queue in app.state.watchers.get(report_uuid, ()):
+        queue.put_nowait({'status': status, 'error_message': error_message})
+
+
+async def audit_worker(queue: asyncio.Queue):
+    """Pull audit jobs off the queue until shutdown"""
+    while True:
+        report_uuid, url = await queue.get()
+        try:
+            await process_audit(report_uuid, url)
+        except Exception as e:
+            # Never let one bad job kill the worker - a shrinking pool
+            # would leave queued audits hanging with no trace
+            print(f"Audit worker error for {report_uuid}: {e}")
+        finally:
+            queue.task_done()
 
 
 async def periodic_cleanup():
@@ -127,11 +183,11 @@ async def submit_audit(
     if GHL_WEBHOOK_URL:
         background_tasks.add_task(send_to_ghl, email, first_name, last_name, url, report_type)
 
-    # Start audit in background
-    background_tasks.add_task(process_audit, report_uuid, url)
+    # Queue the audit for the worker pool
+    await app.state.audit_queue.put((report_uuid, url))
 
     # Redirect to processing page
-    return JSONResponse({
+    return ORJSONResponse({
         "success": True,
         "report_uuid": report_uuid,
         "redirect_url": f"/audit/processing/{report_uuid}"
@@ -149,7 +205,7 @@ async def processing_page(request: Request, report_uuid: str):
     return templates.TemplateResponse("processing.html", {
         "request": request,
         "report_uuid": report_uuid,
-        "url": report['url']
+        "url": report.url
     })
 
 
@@ -161,13 +217,47 @@ async def get_audit_status(report_uuid: str):
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    return JSONResponse({
-        "status": report['status'],
-        "error_message": report.get('error_message'),
-        "completed_at": report.get('completed_at'),
+    return ORJSONResponse({
+        "status": report.status,
+        "error_message": report.error_message,
+        "completed_at": report.completed_at,
     })
 
 
+@app.get("/audit/events/{report_uuid}")
+async def audit_events(report_uuid: str):
+    """Stream audit status transitions as Server-Sent Events"""
+    report = await db.get_report(report_uuid)
+
+    if not report:
+        raise HTTPException(status_code=404, detail="Report not found")
+
+    queue: asyncio.Queue = asyncio.Queue()
+    watchers = app.state.watchers.setdefault(report_uuid, set())
+    watchers.add(queue)
+
+    async def event_gen():
+        try:
+            # Send the current state immediately so late subscribers catch up
+            initial = {'status': report.status, 'error_message': report.error_message}
+            yield f"data: {json.dumps(initial)}\n\n"
+
+            if report.status in ('completed', 'failed'):
+                return
+
+            while True:
+                event = await queue.get()
+                yield f"data: {json.dumps(event)}\n\n"
+                if event.get('status') in ('completed', 'failed'):
+                    return
+        finally:
+            watchers.discard(queue)
+            if not watchers:
+                app.state.watchers.pop(report_uuid, None)
+
+    return StreamingResponse(event_gen(), media_type="text/event-stream")
+
+
 @app.get("/audit/complete/{report_uuid}", response_class=HTMLResponse)
 async def complete_page(request: Request, report_uuid: str):
     """Completion page with download link"""
@@ -176,15 +266,15 @@ async def complete_page(request: Request, report_uuid: str):
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    if report['status'] != 'completed':
+    if report.status != 'completed':
         raise HTTPException(status_code=400, detail="Report not ready yet")
 
     return templates.TemplateResponse("complete.html", {
         "request": request,
         "report_uuid": report_uuid,
-        "url": report['url'],
-        "score": report['score'],
-        "first_name": report['first_name'],
+        "url": report.url,
+        "score": report.score,
+        "first_name": report.first_name,
     })
 
 
@@ -196,10 +286,10 @@ async def download_report(report_uuid: str):
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    if report['status'] != 'completed':
+    if report.status != 'completed':
         raise HTTPException(status_code=400, detail="Report not ready")
 
-    pdf_path = report['pdf_path']
+    pdf_path = report.pdf_path
 
     if not pdf_path or not os.path.exists(pdf_path):
         raise HTTPException(status_code=404, detail="Report file not found")
@@ -207,7 +297,7 @@ async def download_report(report_uuid: str):
     # Log download
     await db.log_event(report_uuid, 'downloaded', 'Report downloaded')
 
-    domain = report['url'].replace('https://', '').replace('http://', '').split('/')[0]
+    domain = report.url.replace('https://', '').replace('http://', '').split('/')[0]
     filename = f"SEO-Audit-{domain}-{datetime.now().strftime('%Y%m%d')}.pdf"
 
     return FileResponse(
@@ -226,52 +316,71 @@ async def health_check():
 # Background Tasks
 
 async def process_audit(report_uuid: str, url: str):
-    """Process audit in background"""
-    async with audit_semaphore:
-        try:
-            await db.update_report_status(report_uuid, 'processing')
-            await db.log_event(report_uuid, 'processing', 'Audit started')
-
-            # Run audit
-            audit_data = await run_seo_audit(url)
-            await db.log_event(report_uuid, 'data_collected', 'Data collection complete')
+    """Process audit (called from the worker pool)"""
+    # Buffer per-step log events and flush them in one write at the end
+    batch = EventBatch(db, report_uuid)
 
-            # Calculate score
-            score_data = calculate_seo_score(audit_data)
-            await db.log_event(report_uuid, 'scored', f"Score calculated: {score_data['total_score']}")
-
-            # Generate PDF
-            pdf_filename = f"report_{report_uuid}.pdf"
-            pdf_path = os.path.join(PDF_STORAGE_PATH, pdf_filename)
+    try:
+        await db.update_report_status(report_uuid, 'processing')
+        batch.add('processing', 'Audit started')
+        notify_watchers(report_uuid, 'processing')
+
+        # Run audit against the shared browser and HTTP client
+        audit_data = await run_seo_audit(
+            url,
+            browser=app.state.browser,
+            http_client=app.state.http
+        )
+        batch.add('data_collected', 'Data collection complete')
+        notify_watchers(report_uuid, 'data_collected')
+
+        # Calculate score
+        score_data = calculate_seo_score(audit_data)
+        batch.add('scored', f"Score calculated: {score_data['total_score']}")
+        notify_watchers(report_uuid, 'scored')
+
+        # Generate PDF
+        pdf_filename = f"report_{report_uuid}.pdf"
+        pdf_path = os.path.join(PDF_STORAGE_PATH, pdf_filename)
+
+        # Render in the process pool - everything crossing the boundary
+        # (dicts and paths) is picklable
+        await asyncio.get_running_loop().run_in_executor(
+            app.state.pdf_pool,
+            generate_pdf_report,
+            audit_data,
+            score_data,
+            pdf_path,
+            'free'
+        )
 
-            generate_pdf_report(
-                audit_data=audit_data,
-                score_data=score_data,
-                output_path=pdf_path,
-                report_type='free'
-            )
+        batch.add('pdf_generated', 'PDF report generated')
+        notify_watchers(report_uuid, 'pdf_generated')
 
-            await db.log_event(report_uuid, 'pdf_generated', 'PDF report generated')
+        # Mark as completed
+        await db.complete_report(
+            uuid=report_uuid,
+            pdf_path=pdf_path,
+            audit_data=audit_data,
+            score=score_data['total_score']
+        )
 
-            # Mark as completed
-            await db.complete_report(
-                uuid=report_uuid,
-                pdf_path=pdf_path,
-                audit_data=audit_data,
-                score=score_data['total_score']
-            )
+        batch.add('completed', 'Audit completed successfully')
+        notify_watchers(report_uuid, 'completed')
 
-            await db.log_event(report_uuid, 'completed', 'Audit completed successfully')
+        # Send email with download link
+        report = await db.get_report(report_uuid)
+        await send_report_email(report)
 
-            # Send email with download link
-            report = await db.get_report(report_uuid)
-            await send_report_email(report)
+    except Exception as e:
+        error_message = str(e)
+        await db.update_report_status(report_uuid, 'failed', error_message)
+        batch.add('failed', f"Error: {error_message}")
+        notify_watchers(report_uuid, 'failed', error_message)
+        print(f"Audit failed for {report_uuid}: {error_message}")
 
-        except Exception as e:
-            error_message = str(e)
-            await db.update_report_status(report_uuid, 'failed', error_message)
-            await db.log_event(report_uuid, 'failed', f"Error: {error_message}")
-            print(f"Audit failed for {report_uuid}: {error_message}")
+    finally:
+        await batch.flush()
 
 
 async def send_to_ghl(email: str, first_name: str, last_name: str, url: str, report_type: str):
@@ -280,33 +389,32 @@ async def send_to_ghl(email: str, first_name: str, last_name: str, url: str, rep
         return
 
     try:
-        async with httpx.AsyncClient() as client:
-            await client.post(
-                GHL_WEBHOOK_URL,
-                json={
-                    "email": email,
-                    "firstName": first_name,
-                    "lastName": last_name,
-                    "website": url,
-                    "reportType": report_type,
-                    "source": "SEO Audit Tool",
-                    "timestamp": datetime.now().isoformat(),
-                },
-                timeout=10.0
-            )
+        await app.state.http.post(
+            GHL_WEBHOOK_URL,
+            json={
+                "email": email,
+                "firstName": first_name,
+                "lastName": last_name,
+                "website": url,
+                "reportType": report_type,
+                "source": "SEO Audit Tool",
+                "timestamp": datetime.now().isoformat(),
+            },
+            timeout=10.0
+        )
     except Exception as e:
         print(f"GHL webhook error: {e}")
 
 
-async def send_report_email(report: dict):
+async def send_report_email(report: Report):
     """Send report email via GHL (or other email service)"""
     # TODO: Implement email sending
     # For now, this is a placeholder
     # You can integrate with GHL's email API or use another service
 
-    download_url = f"{BASE_URL}/audit/complete/{report['uuid']}"
+    download_url = f"{BASE_URL}/audit/complete/{report.uuid}"
 
-    print(f"Email would be sent to: {report['email']}")
+    print(f"Email would be sent to: {report.email}")
     print(f"Download URL: {download_url}")
 
     # Example GHL email API call (implement as needed)
@@ -316,9 +424,9 @@ async def send_report_email(report: dict):
             "https://api.gohighlevel.com/v1/emails",
             headers={"Authorization": f"Bearer {GHL_API_KEY}"},
             json={
-                "to": report['email'],
-                "subject": f"Your SEO Audit Report is Ready - Score: {report['score']}/100",
-                "body": f"Hi {report['first_name']},\n\nYour SEO audit for {report['url']} is complete!\n\nOverall Score: {report['score']}/100\n\nDownload your report: {download_url}\n\nBest,\nLevel Play Digital",
+                "to": report.email,
+                "subject": f"Your SEO Audit Report is Ready - Score: {report.score}/100",
+                "body": f"Hi {report.first_name},\n\nYour SEO audit for {report.url} is complete!\n\nOverall Score: {report.score}/100\n\nDownload your report: {download_url}\n\nBest,\nLevel Play Digital",
             }
         )
     """
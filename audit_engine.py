@@ -2,23 +2,123 @@
 SEO Audit Engine - Playwright-based data collection
 Collects all SEO data in a single browser session for efficiency
 """
-from playwright.async_api import async_playwright, Page, Browser
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from lxml import html as lxml_html
+from lxml.etree import XPath, HTMLPullParser
+from urllib.parse import urlparse, urljoin, quote_plus
 import asyncio
+import httpx
+import orjson
 import re
 import os
 import glob
+import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+# Analytics/tracker hosts blocked during audits - they keep the network busy
+# without affecting the SEO-relevant DOM
+TRACKER_DOMAINS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'facebook.net',
+    'hotjar.com',
+    'clarity.ms',
+)
+
+# Shared parser configured to skip tree content the audit never inspects
+# (comments, processing instructions, the element-id lookup dict)
+_HTML_PARSER = lxml_html.HTMLParser(
+    remove_comments=True,
+    remove_pis=True,
+    collect_ids=False,
+)
+
+# Desktop UA for the plain-HTTP SERP fetch - Google serves the basic
+# result list without JS rendering for a browser-looking client
+_SERP_UA = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+# robots.txt/sitemap existence per domain, cached for an hour - the same
+# sites get re-audited repeatedly
+_DOMAIN_CACHE: Dict[str, tuple] = {}
+_DOMAIN_CACHE_TTL = 3600
+
+# Below this size a one-shot parse is cheaper than streaming
+_LARGE_PAGE_THRESHOLD = 100_000
+
+
+def _parse_html(html: str):
+    """Parse audit HTML, streaming oversized documents.
+
+    Small pages go through the one-shot parser. Large pages are fed to a
+    pull parser in chunks so tokenization stops as soon as </body> has
+    been seen - trailing markup cannot affect any audit field.
+    """
+    if len(html) < _LARGE_PAGE_THRESHOLD:
+        return lxml_html.fromstring(html, parser=_HTML_PARSER)
+
+    # The pull parser lives in lxml.etree; lxml.html does not export it.
+    # Without the class lookup it would build plain _Element trees,
+    # which lack text_content() and the other HtmlElement helpers the
+    # audit consumers rely on.
+    parser = HTMLPullParser(
+        events=('end',),
+        tag='body',
+        remove_comments=True,
+        remove_pis=True,
+    )
+    parser.set_element_class_lookup(lxml_html.HtmlElementClassLookup())
+
+    chunk_size = 64 * 1024
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start:start + chunk_size])
+        if any(True for _ in parser.read_events()):
+            break  # </body> reached; skip whatever trails it
+
+    root = parser.close()
+    return root if root.tag == 'html' else root.getroottree().getroot()
+
+
+# Precompiled XPath expressions - compiled once, reused for every audit
+_HEADING_XPATHS = {f'h{i}': XPath(f'//h{i}') for i in range(1, 7)}
+_IMG_XPATH = XPath('//img')
+_ANCHOR_XPATH = XPath('//a[@href]')
+_LDJSON_XPATH = XPath('//script[@type="application/ld+json"]/text()')
+_META_CONTENT_XPATH = XPath('//meta[@name=$name]/@content')
+_CANONICAL_XPATH = XPath('//link[@rel="canonical"]/@href')
+_SERP_RESULT_XPATH = XPath('//div[contains(concat(" ", normalize-space(@class), " "), " g ")]')
+
+# Keyword cleanup pattern, compiled once
+_KW_CLEAN = re.compile(r'[^\w\s-]')
+
+# Render-friendly launch options (PLAYWRIGHT_BROWSERS_PATH is set in start.sh on Render)
+BROWSER_LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled'
+]
+
 
 class SEOAuditEngine:
-    def __init__(self, url: str, timeout: int = 300000):
+    def __init__(
+        self,
+        url: str,
+        timeout: int = 300000,
+        browser: Optional[Browser] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         self.url = self._normalize_url(url)
         self.timeout = timeout
         self.domain = urlparse(self.url).netloc
+        self.browser = browser
+        self.http_client = http_client
         self.results = {}
+        self._anchors = []  # (href, text) pairs, filled once per audit
 
     def _normalize_url(self, url: str) -> str:
         """Ensure URL has protocol"""
@@ -28,57 +128,98 @@ class SEOAuditEngine:
 
     async def run_audit(self) -> Dict[str, Any]:
         """Main audit orchestrator - runs all checks in one session"""
+        if self.browser is not None:
+            # Shared long-lived browser (launched once at app startup);
+            # each audit gets its own isolated context
+            return await self._run_in_browser(self.browser)
+
+        # Standalone mode: launch a browser just for this audit
         async with async_playwright() as p:
-            # Launch browser with Render-friendly options
-            # PLAYWRIGHT_BROWSERS_PATH is set in start.sh on Render
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled'
-                ]
+            browser = await p.chromium.launch(headless=True, args=BROWSER_LAUNCH_ARGS)
+            try:
+                return await self._run_in_browser(browser)
+            finally:
+                await browser.close()
+
+    async def _run_in_browser(self, browser: Browser) -> Dict[str, Any]:
+        """Run all checks in a fresh context of the given browser"""
+        context = await browser.new_context()
+
+        # Prefer the shared client (keep-alive pool reused across audits);
+        # fall back to a throwaway one in standalone mode
+        owns_client = self.http_client is None
+        self._client = self.http_client or httpx.AsyncClient(follow_redirects=True, timeout=5.0)
+
+        try:
+            # Block trackers - they delay 'load' and skew LCP without
+            # contributing anything to the SEO-relevant DOM
+            await context.route(
+                '**/*',
+                lambda route: route.abort()
+                if any(d in route.request.url for d in TRACKER_DOMAINS)
+                else route.continue_()
             )
 
+            page = await context.new_page()
+            page.set_default_timeout(self.timeout)
+
+            # Navigate to page - 'networkidle' can hang indefinitely on sites
+            # with long-polling beacons; the parsed DOM is all we need
+            await page.goto(self.url, wait_until='domcontentloaded', timeout=self.timeout)
             try:
-                page = await browser.new_page()
-                page.set_default_timeout(self.timeout)
-
-                # Navigate to page
-                await page.goto(self.url, wait_until='networkidle', timeout=self.timeout)
-
-                # Run all audits
-                self.results = {
-                    'url': self.url,
-                    'domain': self.domain,
-                    'audit_date': datetime.now().isoformat(),
-                    'technical': await self._audit_technical(page),
-                    'onpage': await self._audit_onpage(page),
-                    'performance': await self._audit_performance(page),
-                }
+                await page.wait_for_load_state('load', timeout=5000)
+            except Exception:
+                pass  # Best effort - proceed with whatever has loaded
+
+            # Serialize and parse the DOM once; both audit passes share the tree
+            html = await page.content()
+            tree = _parse_html(html)
+
+            # Collect every anchor once; the link analysis and broken-link
+            # checks all consume this list instead of re-walking the tree
+            self._anchors = [
+                (a.get('href', ''), a.text_content().strip()[:50])
+                for a in _ANCHOR_XPATH(tree)
+            ]
+
+            # Run all audit passes concurrently - the performance pass spends
+            # most of its time waiting on in-page timers, during which the
+            # technical and on-page work can proceed
+            technical, onpage, performance = await asyncio.gather(
+                self._audit_technical(page, tree),
+                self._audit_onpage(page, tree),
+                self._audit_performance(page),
+            )
 
-                # Auto-detect primary keyword
-                primary_keyword = self._detect_primary_keyword()
-                self.results['primary_keyword'] = primary_keyword
+            self.results = {
+                'url': self.url,
+                'domain': self.domain,
+                'audit_date': datetime.now().isoformat(),
+                'technical': technical,
+                'onpage': onpage,
+                'performance': performance,
+            }
 
-                # SERP analysis for top 3 competitors
-                if primary_keyword:
-                    self.results['competitors'] = await self._audit_serp(browser, primary_keyword)
+            # Auto-detect primary keyword
+            primary_keyword = self._detect_primary_keyword()
+            self.results['primary_keyword'] = primary_keyword
 
-                return self.results
+            # SERP analysis for top 3 competitors
+            if primary_keyword:
+                self.results['competitors'] = await self._audit_serp(context, primary_keyword)
 
-            except Exception as e:
-                raise Exception(f"Audit failed: {str(e)}")
+            return self.results
 
-            finally:
-                await browser.close()
+        except Exception as e:
+            raise Exception(f"Audit failed: {str(e)}")
 
-    async def _audit_technical(self, page: Page) -> Dict[str, Any]:
-        """Technical SEO checks"""
-        content = await page.content()
-        soup = BeautifulSoup(content, 'lxml')
+        finally:
+            if owns_client:
+                await self._client.aclose()
+            await context.close()
 
+    async def _audit_technical(self, page: Page, tree) -> Dict[str, Any]:
+        """Technical SEO checks"""
         # SSL/HTTPS check
         is_https = self.url.startswith('https://')
 
@@ -87,27 +228,35 @@ class SEOAuditEngine:
         is_mobile_responsive = await self._check_mobile_responsive(page)
 
         # Robots meta tag
-        robots_meta = soup.find('meta', attrs={'name': 'robots'})
-        robots_content = robots_meta.get('content', '') if robots_meta else 'index, follow'
+        robots_meta = _META_CONTENT_XPATH(tree, name='robots')
+        robots_content = robots_meta[0] if robots_meta else 'index, follow'
 
         # Canonical tag
-        canonical = soup.find('link', attrs={'rel': 'canonical'})
-        canonical_url = canonical.get('href', '') if canonical else None
+        canonical = _CANONICAL_XPATH(tree)
+        canonical_url = canonical[0] if canonical else None
 
         # Heading structure
-        headings = self._analyze_headings(soup)
-
-        # Check for robots.txt
-        robots_txt_exists = await self._check_robots_txt(page)
-
-        # Check for XML sitemap
-        sitemap_exists = await self._check_sitemap(page)
+        headings = self._analyze_headings(tree)
+
+        # Check for robots.txt and XML sitemap in parallel - a HEAD status
+        # is all we need, no browser navigation required. Results are
+        # cached per domain since they rarely change between audits.
+        cached = _DOMAIN_CACHE.get(self.domain)
+        if cached and time.monotonic() - cached[0] < _DOMAIN_CACHE_TTL:
+            robots_txt_exists, sitemap_exists = cached[1]
+        else:
+            scheme = urlparse(self.url).scheme
+            robots_txt_exists, sitemap_exists = await asyncio.gather(
+                self._check_exists(f"{scheme}://{self.domain}/robots.txt"),
+                self._check_exists(f"{scheme}://{self.domain}/sitemap.xml"),
+            )
+            _DOMAIN_CACHE[self.domain] = (time.monotonic(), (robots_txt_exists, sitemap_exists))
 
         # Schema markup detection
-        schema_markup = self._detect_schema(soup)
+        schema_markup = self._detect_schema(tree)
 
         # Broken links detection (sample check - first 20 links)
-        broken_links = await self._check_broken_links(page, soup)
+        broken_links = await self._check_broken_links()
 
         return {
             'https': is_https,
@@ -122,31 +271,26 @@ class SEOAuditEngine:
             'broken_links': broken_links,
         }
 
-    async def _audit_onpage(self, page: Page) -> Dict[str, Any]:
+    async def _audit_onpage(self, page: Page, tree) -> Dict[str, Any]:
         """On-page SEO checks"""
-        content = await page.content()
-        soup = BeautifulSoup(content, 'lxml')
-
         # Meta tags
-        title_tag = soup.find('title')
-        title = title_tag.get_text() if title_tag else ''
+        title_tag = tree.find('.//title')
+        title = title_tag.text_content() if title_tag is not None else ''
 
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        description = meta_desc.get('content', '') if meta_desc else ''
+        meta_desc = _META_CONTENT_XPATH(tree, name='description')
+        description = meta_desc[0] if meta_desc else ''
 
-        # Content analysis
-        body_text = soup.body.get_text(separator=' ', strip=True) if soup.body else ''
-        word_count = len(body_text.split())
+        # Content analysis - count words per text node instead of
+        # materializing the whole page text as one string
+        body = tree.find('body')
+        word_count = sum(len(t.split()) for t in body.itertext()) if body is not None else 0
 
         # Image optimization
-        images = soup.find_all('img')
+        images = _IMG_XPATH(tree)
         images_analysis = self._analyze_images(images)
 
-        # Internal links
-        internal_links = self._analyze_links(soup, internal=True)
-
-        # External links
-        external_links = self._analyze_links(soup, internal=False)
+        # Internal and external links (classified in one pass)
+        internal_links, external_links = self._analyze_links()
 
         # URL structure
         url_analysis = self._analyze_url_structure()
@@ -165,33 +309,46 @@ class SEOAuditEngine:
 
     async def _audit_performance(self, page: Page) -> Dict[str, Any]:
         """Performance metrics"""
-        # Get performance metrics
-        performance_timing = await page.evaluate("""
-            () => {
-                const timing = performance.timing;
-                const navigation = performance.getEntriesByType('navigation')[0];
-
-                return {
-                    loadTime: timing.loadEventEnd - timing.navigationStart,
-                    domContentLoaded: timing.domContentLoadedEventEnd - timing.navigationStart,
-                    firstPaint: performance.getEntriesByType('paint')[0]?.startTime || 0,
-                    transferSize: navigation?.transferSize || 0,
-                };
-            }
-        """)
-
-        # Core Web Vitals approximation
-        web_vitals = await page.evaluate("""
+        # Single round trip: timing metrics + Core Web Vitals approximation.
+        # Resolves as soon as the (buffered) LCP entry is observed rather
+        # than waiting a fixed 2 seconds; a short timeout is the safety net
+        # for pages that never produce an LCP entry.
+        metrics = await page.evaluate("""
             () => {
                 return new Promise((resolve) => {
+                    const timing = performance.timing;
+                    const navigation = performance.getEntriesByType('navigation')[0];
                     let lcp = 0;
-                    let fid = 0;
                     let cls = 0;
-
-                    // LCP observer
-                    new PerformanceObserver((entryList) => {
+                    let settled = false;
+
+                    const finalize = () => {
+                        if (settled) return;
+                        settled = true;
+                        // loadEventEnd stays 0 until the load event has
+                        // finished, and navigation only waits for
+                        // domcontentloaded - fall back to the elapsed
+                        // time, a lower bound on the real load time
+                        const loadTime = timing.loadEventEnd > 0
+                            ? timing.loadEventEnd - timing.navigationStart
+                            : Math.round(performance.now());
+                        resolve({
+                            loadTime: loadTime,
+                            domContentLoaded: timing.domContentLoadedEventEnd - timing.navigationStart,
+                            firstPaint: performance.getEntriesByType('paint')[0]?.startTime || 0,
+                            transferSize: navigation?.transferSize || 0,
+                            lcp,
+                            cls,
+                        });
+                    };
+
+                    // LCP observer - buffered entries arrive immediately,
+                    // and LCP is terminal for our purposes
+                    new PerformanceObserver((entryList, observer) => {
                         const entries = entryList.getEntries();
                         lcp = entries[entries.length - 1].startTime;
+                        observer.disconnect();
+                        finalize();
                     }).observe({type: 'largest-contentful-paint', buffered: true});
 
                     // CLS observer
@@ -203,58 +360,30 @@ class SEOAuditEngine:
                         }
                     }).observe({type: 'layout-shift', buffered: true});
 
-                    setTimeout(() => {
-                        resolve({ lcp, fid, cls });
-                    }, 2000);
+                    // Safety net if no LCP entry ever fires
+                    setTimeout(finalize, 500);
                 });
             }
         """)
 
         return {
-            'load_time_ms': performance_timing['loadTime'],
-            'dom_content_loaded_ms': performance_timing['domContentLoaded'],
-            'first_paint_ms': performance_timing['firstPaint'],
-            'transfer_size_bytes': performance_timing['transferSize'],
-            'lcp': web_vitals.get('lcp', 0),
-            'cls': web_vitals.get('cls', 0),
+            'load_time_ms': metrics['loadTime'],
+            'dom_content_loaded_ms': metrics['domContentLoaded'],
+            'first_paint_ms': metrics['firstPaint'],
+            'transfer_size_bytes': metrics['transferSize'],
+            'lcp': metrics.get('lcp', 0),
+            'cls': metrics.get('cls', 0),
         }
 
-    async def _audit_serp(self, browser: Browser, keyword: str) -> Dict[str, Any]:
+    async def _audit_serp(self, context: BrowserContext, keyword: str) -> Dict[str, Any]:
         """Analyze top 3 competitors from Google SERP"""
         try:
-            page = await browser.new_page()
-
-            # Search Google
-            search_url = f"https://www.google.com/search?q={keyword.replace(' ', '+')}"
-            await page.goto(search_url, wait_until='networkidle', timeout=30000)
-
-            # Extract top 10 organic results
-            competitors = await page.evaluate("""
-                () => {
-                    const results = [];
-                    const searchResults = document.querySelectorAll('div.g');
-
-                    for (let i = 0; i < Math.min(10, searchResults.length); i++) {
-                        const result = searchResults[i];
-                        const titleEl = result.querySelector('h3');
-                        const linkEl = result.querySelector('a');
-                        const descEl = result.querySelector('div[data-sncf]');
-
-                        if (titleEl && linkEl) {
-                            results.push({
-                                position: i + 1,
-                                title: titleEl.innerText,
-                                url: linkEl.href,
-                                description: descEl ? descEl.innerText : '',
-                            });
-                        }
-                    }
-
-                    return results;
-                }
-            """)
-
-            await page.close()
+            # Plain HTTP fetch first - an order of magnitude cheaper than a
+            # Chromium navigation; fall back to the browser if Google serves
+            # a JS-only page or blocks the request
+            competitors = await self._fetch_serp_http(keyword)
+            if competitors is None:
+                competitors = await self._fetch_serp_browser(context, keyword)
 
             # Analyze top 3 competitors
             top_competitors = []
@@ -290,14 +419,81 @@ class SEOAuditEngine:
                 'top_competitors': [],
             }
 
+    async def _fetch_serp_http(self, keyword: str) -> Optional[List[Dict[str, Any]]]:
+        """Fetch organic results over plain HTTP; None means fall back"""
+        try:
+            response = await self._client.get(
+                f"https://www.google.com/search?q={quote_plus(keyword)}",
+                headers={'User-Agent': _SERP_UA, 'Accept-Language': 'en-US'},
+                timeout=10.0,
+            )
+            if response.status_code != 200:
+                return None
+
+            tree = lxml_html.fromstring(response.text, parser=_HTML_PARSER)
+            results = []
+
+            for i, result in enumerate(_SERP_RESULT_XPATH(tree)[:10]):
+                title_el = result.find('.//h3')
+                link_el = result.find('.//a[@href]')
+                desc_el = result.find('.//div[@data-sncf]')
+
+                if title_el is not None and link_el is not None:
+                    results.append({
+                        'position': i + 1,
+                        'title': title_el.text_content(),
+                        'url': link_el.get('href'),
+                        'description': desc_el.text_content() if desc_el is not None else '',
+                    })
+
+            return results or None
+
+        except Exception:
+            return None
+
+    async def _fetch_serp_browser(self, context: BrowserContext, keyword: str) -> List[Dict[str, Any]]:
+        """Fetch organic results with a full browser navigation"""
+        page = await context.new_page()
+        try:
+            # Search Google
+            search_url = f"https://www.google.com/search?q={keyword.replace(' ', '+')}"
+            await page.goto(search_url, wait_until='networkidle', timeout=30000)
+
+            # Extract top 10 organic results
+            return await page.evaluate("""
+                () => {
+                    const results = [];
+                    const searchResults = document.querySelectorAll('div.g');
+
+                    for (let i = 0; i < Math.min(10, searchResults.length); i++) {
+                        const result = searchResults[i];
+                        const titleEl = result.querySelector('h3');
+                        const linkEl = result.querySelector('a');
+                        const descEl = result.querySelector('div[data-sncf]');
+
+                        if (titleEl && linkEl) {
+                            results.push({
+                                position: i + 1,
+                                title: titleEl.innerText,
+                                url: linkEl.href,
+                                description: descEl ? descEl.innerText : '',
+                            });
+                        }
+                    }
+
+                    return results;
+                }
+            """)
+        finally:
+            await page.close()
+
     # Helper methods
 
-    def _analyze_headings(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_headings(self, tree) -> Dict[str, Any]:
         """Analyze heading structure"""
         headings = {}
-        for i in range(1, 7):
-            h_tags = soup.find_all(f'h{i}')
-            headings[f'h{i}'] = [h.get_text(strip=True) for h in h_tags]
+        for tag, xpath in _HEADING_XPATHS.items():
+            headings[tag] = [h.text_content().strip() for h in xpath(tree)]
 
         return {
             'structure': headings,
@@ -319,25 +515,21 @@ class SEOAuditEngine:
             'alt_percentage': round(images_with_alt / total_images * 100, 1) if total_images > 0 else 0,
         }
 
-    def _analyze_links(self, soup: BeautifulSoup, internal: bool = True) -> Dict[str, Any]:
-        """Analyze internal or external links"""
-        links = soup.find_all('a', href=True)
-        filtered_links = []
+    def _analyze_links(self) -> tuple:
+        """Classify all links as internal or external in a single pass"""
+        internal_links = []
+        external_links = []
 
-        for link in links:
-            href = link.get('href', '')
-            is_internal = href.startswith('/') or self.domain in href
+        for href, text in self._anchors:
+            if href.startswith('/') or self.domain in href:
+                internal_links.append({'href': href, 'text': text})
+            elif href.startswith('http'):
+                external_links.append({'href': href, 'text': text})
 
-            if (internal and is_internal) or (not internal and not is_internal and href.startswith('http')):
-                filtered_links.append({
-                    'href': href,
-                    'text': link.get_text(strip=True)[:50],
-                })
-
-        return {
-            'count': len(filtered_links),
-            'sample': filtered_links[:10],  # First 10 links
-        }
+        return (
+            {'count': len(internal_links), 'sample': internal_links[:10]},  # First 10 links
+            {'count': len(external_links), 'sample': external_links[:10]},
+        )
 
     def _analyze_url_structure(self) -> Dict[str, Any]:
         """Analyze URL structure"""
@@ -367,7 +559,7 @@ class SEOAuditEngine:
             return None
 
         # Clean up keyword
-        keyword = re.sub(r'[^\w\s-]', '', keyword)
+        keyword = _KW_CLEAN.sub('', keyword)
         words = keyword.split()[:5]  # First 5 words
         return ' '.join(words) if words else None
 
@@ -381,68 +573,65 @@ class SEOAuditEngine:
         """)
         return meta_viewport is not None and 'width=device-width' in meta_viewport
 
-    async def _check_robots_txt(self, page: Page) -> bool:
-        """Check if robots.txt exists"""
+    async def _check_exists(self, url: str) -> bool:
+        """Check whether a URL responds 200 to a HEAD request"""
         try:
-            robots_url = f"{urlparse(self.url).scheme}://{self.domain}/robots.txt"
-            response = await page.goto(robots_url, timeout=10000)
-            return response.status == 200
+            response = await self._client.head(url)
+            return response.status_code == 200
         except:
             return False
 
-    async def _check_sitemap(self, page: Page) -> bool:
-        """Check if XML sitemap exists"""
-        try:
-            sitemap_url = f"{urlparse(self.url).scheme}://{self.domain}/sitemap.xml"
-            response = await page.goto(sitemap_url, timeout=10000)
-            return response.status == 200
-        except:
-            return False
-
-    def _detect_schema(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _detect_schema(self, tree) -> Dict[str, Any]:
         """Detect schema markup"""
-        schema_scripts = soup.find_all('script', attrs={'type': 'application/ld+json'})
+        schema_scripts = _LDJSON_XPATH(tree)
 
         return {
             'has_schema': len(schema_scripts) > 0,
             'schema_count': len(schema_scripts),
-            'schema_types': [self._extract_schema_type(script.string) for script in schema_scripts if script.string],
+            'schema_types': [self._extract_schema_type(script) for script in schema_scripts if script.strip()],
         }
 
     def _extract_schema_type(self, schema_json: str) -> str:
         """Extract @type from schema JSON"""
         try:
-            import json
-            data = json.loads(schema_json)
+            data = orjson.loads(schema_json)
             return data.get('@type', 'Unknown')
         except:
             return 'Invalid'
 
-    async def _check_broken_links(self, page: Page, soup: BeautifulSoup) -> Dict[str, Any]:
+    async def _check_broken_links(self) -> Dict[str, Any]:
         """Check for broken links (sample of first 20 links)"""
-        links = soup.find_all('a', href=True)[:20]
-        broken = []
+        links = self._anchors[:20]
+        urls = []
 
-        for link in links:
-            href = link.get('href', '')
+        for href, _ in links:
             if not href or href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
                 continue
 
             # Make absolute URL
-            absolute_url = urljoin(self.url, href)
-
-            try:
-                response = await page.goto(absolute_url, timeout=5000, wait_until='domcontentloaded')
-                if response.status >= 400:
-                    broken.append({
-                        'url': href,
-                        'status': response.status,
-                    })
-            except:
-                broken.append({
-                    'url': href,
-                    'status': 'timeout/error',
-                })
+            urls.append((href, urljoin(self.url, href)))
+
+        # Fan out HEAD probes concurrently (bounded to be polite to the host)
+        semaphore = asyncio.Semaphore(8)
+
+        async def check(href: str, absolute_url: str):
+            async with semaphore:
+                try:
+                    response = await self._client.head(absolute_url)
+                    if response.status_code == 405:
+                        # Some servers reject HEAD; retry with GET
+                        response = await self._client.get(absolute_url)
+                    return href, response.status_code
+                except Exception:
+                    return href, 'timeout/error'
+
+        results = await asyncio.gather(*(check(href, url) for href, url in urls))
+
+        broken = [
+            {'url': href, 'status': status}
+            for href, status in results
+            if status == 'timeout/error' or (isinstance(status, int) and status >= 400)
+        ]
 
         return {
             'checked': len(links),
@@ -451,7 +640,11 @@ class SEOAuditEngine:
         }
 
 
-async def run_seo_audit(url: str) -> Dict[str, Any]:
+async def run_seo_audit(
+    url: str,
+    browser: Optional[Browser] = None,
+    http_client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, Any]:
     """Convenience function to run audit"""
-    engine = SEOAuditEngine(url)
+    engine = SEOAuditEngine(url, browser=browser, http_client=http_client)
     return await engine.run_audit()
@@ -3,26 +3,235 @@ Database module for SEO Audit Tool
 Handles SQLite operations for reports and OAuth tokens
 """
 import aiosqlite
+import asyncio
+import base64
+import hashlib
 import os
-import json
+import orjson
+import zstandard
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
-from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+# Size of the read connection pool - under WAL, readers run in parallel
+# with the single writer without blocking
+READ_POOL_SIZE = 4
+
+# Audit-log flusher: wait this long after the first queued event so a
+# burst lands in one transaction, and cap how many rows drain per flush
+LOG_FLUSH_DELAY = 0.025
+LOG_FLUSH_MAX_BATCH = 500
+
+# Audit payloads are nested dicts with heavy key repetition - zstd
+# typically shrinks them 5-10x, so rows stay within fewer pages
+AUDIT_CODEC = 'zstd+orjson'
+_zstd_compress = zstandard.ZstdCompressor(level=3).compress
+_zstd_decompress = zstandard.ZstdDecompressor().decompress
+
+# Statements on the hot path, hoisted so every call passes the same
+# string object and hits sqlite3's per-connection statement cache
+# instead of re-running the parser and bytecode compiler
+INSERT_REPORT_SQL = """
+    INSERT INTO reports (uuid, url, email, first_name, last_name, report_type, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPDATE_STATUS_SQL = """
+    UPDATE reports
+    SET status = ?
+    WHERE uuid = ?
+"""
+
+UPDATE_STATUS_ERROR_SQL = """
+    UPDATE reports
+    SET status = ?, error_message = ?
+    WHERE uuid = ?
+"""
+
+COMPLETE_REPORT_SQL = """
+    UPDATE reports
+    SET status = 'completed',
+        pdf_path = ?,
+        audit_data = ?,
+        audit_codec = ?,
+        score = ?,
+        completed_at = CURRENT_TIMESTAMP
+    WHERE uuid = ?
+"""
+
+# Columns listed explicitly in Report field order: SELECT * would break
+# the positional unpack on migrated databases, where ALTER TABLE
+# appends later columns (audit_codec) at the end of the row
+SELECT_REPORT_SQL = """
+    SELECT id, uuid, url, email, first_name, last_name, report_type,
+           status, pdf_path, audit_data, audit_codec, score,
+           error_message, created_at, completed_at, expires_at
+    FROM reports WHERE uuid = ?
+"""
+
+INSERT_EVENT_SQL = """
+    INSERT INTO audit_log (report_uuid, event_type, message, timestamp)
+    VALUES (?, ?, ?, ?)
+"""
+
+DELETE_EXPIRED_SQL = """
+    DELETE FROM reports WHERE expires_at < CURRENT_TIMESTAMP
+    RETURNING pdf_path
+"""
+
+INSERT_TOKEN_SQL = """
+    INSERT INTO oauth_tokens (report_id, service, encrypted_token, token_hash)
+    VALUES (?, ?, ?, ?)
+"""
+
+SELECT_TOKEN_SQL = """
+    SELECT encrypted_token FROM oauth_tokens
+    WHERE report_id = ? AND service = ?
+    ORDER BY created_at DESC LIMIT 1
+"""
+
+FIND_TOKEN_SQL = "SELECT * FROM oauth_tokens WHERE token_hash = ?"
+
+
+@dataclass(slots=True)
+class Report:
+    """One reports row; field order mirrors the table declaration"""
+    id: int
+    uuid: str
+    url: str
+    email: str
+    first_name: str
+    last_name: str
+    report_type: str
+    status: str
+    pdf_path: Optional[str]
+    audit_data: Optional[Any]
+    audit_codec: Optional[str]
+    score: Optional[int]
+    error_message: Optional[str]
+    created_at: Optional[str]
+    completed_at: Optional[str]
+    expires_at: Optional[str]
 
 
 class Database:
     def __init__(self, db_path: str, encryption_key: str):
         self.db_path = db_path
-        self.cipher = Fernet(encryption_key.encode() if len(encryption_key) == 44 else Fernet.generate_key())
+        # AES-GCM fuses encrypt + authenticate in one hardware-backed
+        # pass; the key is the same 44-char urlsafe-base64 format the
+        # old Fernet setup used (decodes to 32 bytes)
+        if len(encryption_key) == 44:
+            key_bytes = base64.urlsafe_b64decode(encryption_key.encode())
+        else:
+            key_bytes = AESGCM.generate_key(bit_length=256)
+        self._aead = AESGCM(key_bytes)
         self._ensure_directory()
+        self._write_conn: Optional[aiosqlite.Connection] = None
+        self._read_pool: Optional[asyncio.Queue] = None
+        self._write_lock = asyncio.Lock()
+        self._log_queue: Optional[asyncio.Queue] = None
+        self._log_flush_task: Optional[asyncio.Task] = None
 
     def _ensure_directory(self):
         """Ensure database directory exists"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
+    async def _connect(self, apply_wal: bool = False, readonly: bool = False) -> aiosqlite.Connection:
+        """Open a connection with the WAL tuning bundle applied
+
+        journal_mode persists in the database file, so only the first
+        connection of the process needs to set it; the remaining PRAGMAs
+        are per-connection and run every time. Reader connections open
+        with mode=ro so a stray write on the read path fails loudly.
+        """
+        if readonly:
+            db = await aiosqlite.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, cached_statements=256
+            )
+        else:
+            db = await aiosqlite.connect(self.db_path, cached_statements=256)
+        db.row_factory = aiosqlite.Row
+        if apply_wal:
+            await db.execute("PRAGMA journal_mode=WAL")
+        await db.execute("PRAGMA synchronous=NORMAL")
+        await db.execute("PRAGMA busy_timeout=5000")
+        await db.execute("PRAGMA temp_store=memory")
+        await db.execute("PRAGMA cache_size=-20000")
+        await db.execute("PRAGMA foreign_keys=ON")
+        return db
+
+    @asynccontextmanager
+    async def acquire_write(self):
+        """Borrow the single long-lived writer connection"""
+        async with self._write_lock:
+            yield self._write_conn
+
+    @asynccontextmanager
+    async def _writer(self, db):
+        """Run a write transaction, taking the reserved lock up front
+
+        BEGIN IMMEDIATE avoids the deferred read-to-write lock upgrade
+        that produces SQLITE_BUSY mid-transaction; contention resolves
+        via busy_timeout instead. Commits on success, rolls back on
+        exception.
+        """
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            await db.rollback()
+            raise
+        else:
+            await db.commit()
+
+    @asynccontextmanager
+    async def acquire_read(self):
+        """Borrow a reader connection from the pool"""
+        conn = await self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put_nowait(conn)
+
+    async def close(self):
+        """Flush pending events and close all pooled connections"""
+        if self._log_flush_task is not None:
+            self._log_flush_task.cancel()
+            # Wait for the cancellation to land: the flusher requeues
+            # its in-flight event on CancelledError, and that must
+            # happen before the final flush below drains the queue
+            try:
+                await self._log_flush_task
+            except asyncio.CancelledError:
+                pass
+            self._log_flush_task = None
+        if self._log_queue is not None:
+            await self.flush()
+            self._log_queue = None
+        if self._write_conn is not None:
+            await self._write_conn.close()
+            self._write_conn = None
+        if self._read_pool is not None:
+            while not self._read_pool.empty():
+                conn = self._read_pool.get_nowait()
+                await conn.close()
+            self._read_pool = None
+
+    @staticmethod
+    async def _ensure_column(db, table: str, column: str, decl: str):
+        """Add a column to a pre-existing table if it is missing"""
+        cursor = await db.execute(f"PRAGMA table_info({table})")
+        existing = {row[1] for row in await cursor.fetchall()}
+        if column not in existing:
+            await db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
     async def initialize(self):
-        """Initialize database tables"""
-        async with aiosqlite.connect(self.db_path) as db:
+        """Open connection pools and initialize database tables"""
+        self._write_conn = await self._connect(apply_wal=True)
+
+        async with self.acquire_write() as conn, self._writer(conn) as db:
             # Reports table
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS reports (
@@ -35,7 +244,8 @@ class Database:
                     report_type TEXT DEFAULT 'free',
                     status TEXT DEFAULT 'pending',
                     pdf_path TEXT,
-                    audit_data TEXT,
+                    audit_data BLOB,
+                    audit_codec TEXT,
                     score INTEGER,
                     error_message TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -44,18 +254,32 @@ class Database:
                 )
             """)
 
-            # OAuth tokens table (for paid tier)
+            # OAuth tokens table (for paid tier). token_hash allows
+            # indexed lookup by value - Fernet ciphertext is
+            # non-deterministic, so the ciphertext itself can't be queried
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS oauth_tokens (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     report_id INTEGER NOT NULL,
                     service TEXT NOT NULL,
                     encrypted_token TEXT NOT NULL,
+                    token_hash TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (report_id) REFERENCES reports (id)
                 )
             """)
 
+            # Columns added after the original schema shipped; the
+            # persistent disk carries databases created by older builds,
+            # and CREATE TABLE IF NOT EXISTS never alters those
+            await self._ensure_column(db, 'reports', 'audit_codec', 'TEXT')
+            await self._ensure_column(db, 'oauth_tokens', 'token_hash', 'TEXT')
+
+            await db.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS ix_oauth_hash
+                ON oauth_tokens(token_hash)
+            """)
+
             # Audit log table
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS audit_log (
@@ -67,7 +291,37 @@ class Database:
                 )
             """)
 
-            await db.commit()
+            # Expiry index so cleanup is a range seek instead of a full
+            # table scan. Must be unqualified: the cleanup DELETE's
+            # predicate doesn't imply pdf_path IS NOT NULL, so SQLite
+            # can't use a partial variant - drop one if an earlier
+            # build created it
+            cursor = await db.execute("""
+                SELECT sql FROM sqlite_master
+                WHERE type = 'index' AND name = 'ix_reports_expires'
+            """)
+            existing_index = await cursor.fetchone()
+            if existing_index and 'WHERE' in (existing_index[0] or '').upper():
+                await db.execute("DROP INDEX ix_reports_expires")
+
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS ix_reports_expires
+                ON reports(expires_at)
+            """)
+
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS ix_audit_uuid
+                ON audit_log(report_uuid)
+            """)
+
+        # Readers open after the schema exists (mode=ro requires the file)
+        self._read_pool = asyncio.Queue(maxsize=READ_POOL_SIZE)
+        for _ in range(READ_POOL_SIZE):
+            self._read_pool.put_nowait(await self._connect(readonly=True))
+
+        # Background flusher coalescing single log events into batches
+        self._log_queue = asyncio.Queue()
+        self._log_flush_task = asyncio.create_task(self._log_flusher())
 
     async def create_report(
         self,
@@ -81,15 +335,26 @@ class Database:
         """Create a new report entry"""
         expires_at = datetime.now() + timedelta(days=3)
 
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute("""
-                INSERT INTO reports (uuid, url, email, first_name, last_name, report_type, expires_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (uuid, url, email, first_name, last_name, report_type, expires_at))
+        async with self.acquire_write() as conn, self._writer(conn) as db:
+            cursor = await db.execute(
+                INSERT_REPORT_SQL,
+                (uuid, url, email, first_name, last_name, report_type, expires_at)
+            )
 
-            await db.commit()
             return cursor.lastrowid
 
+    async def create_reports_bulk(self, rows):
+        """Insert a batch of reports in a single write transaction
+
+        Each row is a (uuid, url, email, first_name, last_name,
+        report_type, expires_at) tuple.
+        """
+        if not rows:
+            return
+
+        async with self.acquire_write() as conn, self._writer(conn) as db:
+            await db.executemany(INSERT_REPORT_SQL, rows)
+
     async def update_report_status(
         self,
         uuid: str,
@@ -97,21 +362,11 @@ class Database:
         error_message: Optional[str] = None
     ):
         """Update report status"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.acquire_write() as conn, self._writer(conn) as db:
             if error_message:
-                await db.execute("""
-                    UPDATE reports
-                    SET status = ?, error_message = ?
-                    WHERE uuid = ?
-                """, (status, error_message, uuid))
+                await db.execute(UPDATE_STATUS_ERROR_SQL, (status, error_message, uuid))
             else:
-                await db.execute("""
-                    UPDATE reports
-                    SET status = ?
-                    WHERE uuid = ?
-                """, (status, uuid))
-
-            await db.commit()
+                await db.execute(UPDATE_STATUS_SQL, (status, uuid))
 
     async def complete_report(
         self,
@@ -121,99 +376,147 @@ class Database:
         score: int
     ):
         """Mark report as completed with results"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                UPDATE reports
-                SET status = 'completed',
-                    pdf_path = ?,
-                    audit_data = ?,
-                    score = ?,
-                    completed_at = CURRENT_TIMESTAMP
-                WHERE uuid = ?
-            """, (pdf_path, json.dumps(audit_data), score, uuid))
+        payload = _zstd_compress(orjson.dumps(audit_data))
 
-            await db.commit()
+        async with self.acquire_write() as conn, self._writer(conn) as db:
+            await db.execute(
+                COMPLETE_REPORT_SQL,
+                (pdf_path, payload, AUDIT_CODEC, score, uuid)
+            )
 
-    async def get_report(self, uuid: str) -> Optional[Dict[str, Any]]:
-        """Get report by UUID"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("""
-                SELECT * FROM reports WHERE uuid = ?
-            """, (uuid,))
+    async def get_report(self, uuid: str) -> Optional[Report]:
+        """Get report by UUID
+
+        Returns a Report - a flat slots dataclass rather than a dict,
+        so building it is one tuple unpack instead of N hash inserts.
+        """
+        async with self.acquire_read() as db:
+            cursor = await db.execute(SELECT_REPORT_SQL, (uuid,))
 
             row = await cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
+            if row is None:
+                return None
+
+            report = Report(*row)
+            # Decode once here so callers always see a dict; rows from
+            # before the compressed-blob format are plain JSON text
+            if report.audit_data:
+                if report.audit_codec == AUDIT_CODEC:
+                    report.audit_data = orjson.loads(_zstd_decompress(report.audit_data))
+                else:
+                    report.audit_data = orjson.loads(report.audit_data)
+            return report
 
     async def log_event(self, report_uuid: str, event_type: str, message: str = None):
-        """Log an audit event"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                INSERT INTO audit_log (report_uuid, event_type, message)
-                VALUES (?, ?, ?)
-            """, (report_uuid, event_type, message))
-
-            await db.commit()
+        """Queue an audit event; the background flusher batches the write"""
+        await self._log_queue.put((report_uuid, event_type, message, datetime.now()))
+
+    def _drain_log_queue(self):
+        """Pull up to LOG_FLUSH_MAX_BATCH pending events off the queue"""
+        rows = []
+        while len(rows) < LOG_FLUSH_MAX_BATCH:
+            try:
+                rows.append(self._log_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return rows
+
+    async def _log_flusher(self):
+        """Coalesce queued audit events into batched transactions"""
+        while True:
+            first = await self._log_queue.get()
+            try:
+                await asyncio.sleep(LOG_FLUSH_DELAY)  # let a burst accumulate
+            except asyncio.CancelledError:
+                # Cancelled mid-coalesce (shutdown): put the popped event
+                # back so the closing flush() still writes it
+                self._log_queue.put_nowait(first)
+                raise
+            try:
+                await self.log_events_bulk([first] + self._drain_log_queue())
+            except Exception as e:
+                # A transient write failure must not kill the flusher -
+                # nothing else drains the queue until shutdown
+                print(f"Audit log flush error: {e}")
+
+    async def flush(self):
+        """Write out any pending audit events immediately"""
+        await self.log_events_bulk(self._drain_log_queue())
+
+    async def log_events_bulk(self, events):
+        """Insert a batch of audit events in a single transaction
+
+        Each event is a (report_uuid, event_type, message, timestamp) tuple.
+        """
+        if not events:
+            return
+
+        async with self.acquire_write() as conn, self._writer(conn) as db:
+            await db.executemany(INSERT_EVENT_SQL, events)
 
     async def cleanup_expired_reports(self):
         """Delete expired reports and their PDFs"""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Get expired report PDFs
-            cursor = await db.execute("""
-                SELECT pdf_path FROM reports
-                WHERE expires_at < CURRENT_TIMESTAMP AND pdf_path IS NOT NULL
-            """)
+        async with self.acquire_write() as conn, self._writer(conn) as db:
+            # RETURNING fuses the old SELECT + DELETE into one statement
+            cursor = await db.execute(DELETE_EXPIRED_SQL)
 
             rows = await cursor.fetchall()
 
-            # Delete PDF files
-            for row in rows:
-                pdf_path = row[0]
-                if os.path.exists(pdf_path):
-                    try:
-                        os.remove(pdf_path)
-                    except Exception as e:
-                        print(f"Error deleting PDF {pdf_path}: {e}")
-
-            # Delete database records
-            await db.execute("""
-                DELETE FROM reports WHERE expires_at < CURRENT_TIMESTAMP
-            """)
-
-            await db.commit()
+        # Unlink off the event loop; a missing file is not an error
+        await asyncio.gather(
+            *[asyncio.to_thread(os.remove, row[0])
+              for row in rows if row[0] and os.path.exists(row[0])],
+            return_exceptions=True
+        )
 
     # OAuth Token Management (for paid tier)
+    #
+    # Tokens stay encrypted at the application layer. Whole-database
+    # encryption (SQLCipher / filesystem-level) was considered instead,
+    # but there is no maintained async SQLCipher driver to replace
+    # aiosqlite with, and full-disk encryption is a deployment concern
+    # this module can't assume. Per-row AES-GCM costs microseconds on
+    # the rare token paths, so it is not worth the dependency swap.
 
     def encrypt_token(self, token: str) -> str:
-        """Encrypt OAuth token"""
-        return self.cipher.encrypt(token.encode()).decode()
+        """Encrypt OAuth token (AES-256-GCM, nonce prepended)"""
+        nonce = os.urandom(12)
+        ciphertext = self._aead.encrypt(nonce, token.encode(), None)
+        return base64.urlsafe_b64encode(nonce + ciphertext).decode()
 
     def decrypt_token(self, encrypted_token: str) -> str:
         """Decrypt OAuth token"""
-        return self.cipher.decrypt(encrypted_token.encode()).decode()
+        raw = base64.urlsafe_b64decode(encrypted_token.encode())
+        return self._aead.decrypt(raw[:12], raw[12:], None).decode()
+
+    def _hash_token(self, token: str) -> str:
+        """Deterministic digest of a token for indexed lookup"""
+        return hashlib.sha256(token.encode()).hexdigest()
 
     async def store_oauth_token(self, report_id: int, service: str, token: str):
         """Store encrypted OAuth token"""
         encrypted = self.encrypt_token(token)
 
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                INSERT INTO oauth_tokens (report_id, service, encrypted_token)
-                VALUES (?, ?, ?)
-            """, (report_id, service, encrypted))
+        async with self.acquire_write() as conn, self._writer(conn) as db:
+            await db.execute(
+                INSERT_TOKEN_SQL,
+                (report_id, service, encrypted, self._hash_token(token))
+            )
 
-            await db.commit()
+    async def find_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """Look up a stored token by value via its indexed hash"""
+        async with self.acquire_read() as db:
+            cursor = await db.execute(FIND_TOKEN_SQL, (self._hash_token(token),))
+
+            row = await cursor.fetchone()
+            if row:
+                return dict(row)
+            return None
 
     async def get_oauth_token(self, report_id: int, service: str) -> Optional[str]:
         """Get decrypted OAuth token"""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute("""
-                SELECT encrypted_token FROM oauth_tokens
-                WHERE report_id = ? AND service = ?
-                ORDER BY created_at DESC LIMIT 1
-            """, (report_id, service))
+        async with self.acquire_read() as db:
+            cursor = await db.execute(SELECT_TOKEN_SQL, (report_id, service))
 
             row = await cursor.fetchone()
             if row:
@@ -221,6 +524,26 @@ class Database:
             return None
 
 
+class EventBatch:
+    """Buffer audit events in memory and flush them in one write
+
+    Used by long-running jobs (audit processing) that would otherwise
+    commit half a dozen single-row inserts back to back.
+    """
+
+    def __init__(self, db: Database, report_uuid: str):
+        self.db = db
+        self.report_uuid = report_uuid
+        self.rows = []
+
+    def add(self, event_type: str, message: str = None):
+        self.rows.append((self.report_uuid, event_type, message, datetime.now()))
+
+    async def flush(self):
+        rows, self.rows = self.rows, []
+        await self.db.log_events_bulk(rows)
+
+
 # Singleton instance
 _db_instance: Optional[Database] = None
 
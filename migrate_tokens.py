@@ -0,0 +1,54 @@
+"""
+One-shot migration: re-encrypt stored OAuth tokens from Fernet to AES-GCM
+
+Run once after deploying the AES-GCM change, then delete or ignore.
+Uses the same ENCRYPTION_KEY the app was configured with (the 44-char
+urlsafe-base64 key works for both schemes).
+
+    DATABASE_PATH=./data/audit.db ENCRYPTION_KEY=... python migrate_tokens.py
+"""
+import base64
+import os
+import sqlite3
+
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+# Same default as app.py, so running without DATABASE_PATH set hits
+# the real database rather than creating an empty one
+DB_PATH = os.getenv('DATABASE_PATH', './data/audit.db')
+ENCRYPTION_KEY = os.environ['ENCRYPTION_KEY']
+
+
+def main():
+    fernet = Fernet(ENCRYPTION_KEY.encode())
+    aead = AESGCM(base64.urlsafe_b64decode(ENCRYPTION_KEY.encode()))
+
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute("SELECT id, encrypted_token FROM oauth_tokens").fetchall()
+
+    migrated = 0
+    for row_id, encrypted_token in rows:
+        try:
+            token = fernet.decrypt(encrypted_token.encode())
+        except InvalidToken:
+            # Already AES-GCM (or unreadable) - leave it alone
+            continue
+
+        nonce = os.urandom(12)
+        reencrypted = base64.urlsafe_b64encode(
+            nonce + aead.encrypt(nonce, token, None)
+        ).decode()
+        conn.execute(
+            "UPDATE oauth_tokens SET encrypted_token = ? WHERE id = ?",
+            (reencrypted, row_id)
+        )
+        migrated += 1
+
+    conn.commit()
+    conn.close()
+    print(f"Re-encrypted {migrated} of {len(rows)} tokens")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,36 +3,71 @@ PDF Report Generator with WeasyPrint
 Generates professional SEO audit reports with LPD branding
 """
 from weasyprint import HTML, CSS
-from jinja2 import Environment, FileSystemLoader
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+# Figure + FigureCanvasAgg directly: the pyplot state machine keeps a
+# thread-locked registry of every figure and leaks them if close() is
+# ever missed
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image, ImageDraw, ImageFont
+import asyncio
+import functools
 import io
-import base64
 from datetime import datetime
 from typing import Dict, Any
 import os
 
+# LPD Brand Colors (module level so chart workers can pickle calls)
+COLORS = {
+    'primary_navy': '#1E2E52',
+    'accent_orange': '#FF4D26',
+    'accent_cyan': '#00B8D9',
+    'dark_900': '#0A1220',
+    'light_100': '#F5F5F7',
+    'light_300': '#D6D6DE',
+    'text_dark': '#1C2B4D',
+    'background': '#FFFFFF',
+    'border': '#E6E6EB',
+}
+
+# The report charts use a tiny slice of matplotlib; direct Pillow
+# drawing skips its layout/transform machinery entirely. Set
+# USE_MATPLOTLIB_CHARTS=true to fall back to the old renderer.
+USE_MATPLOTLIB_CHARTS = os.getenv('USE_MATPLOTLIB_CHARTS', 'false').lower() == 'true'
+
+RED = '#F24444'
+
+
+def _score_color(score: float, good: float = 80, warn: float = 60) -> str:
+    """Cyan/orange/red by threshold - shared by all charts"""
+    if score >= good:
+        return COLORS['accent_cyan']
+    if score >= warn:
+        return COLORS['accent_orange']
+    return RED
+
 
 class ReportGenerator:
     """Generate PDF reports with Level Play Digital branding"""
 
-    # LPD Brand Colors
-    COLORS = {
-        'primary_navy': '#1E2E52',
-        'accent_orange': '#FF4D26',
-        'accent_cyan': '#00B8D9',
-        'dark_900': '#0A1220',
-        'light_100': '#F5F5F7',
-        'light_300': '#D6D6DE',
-        'text_dark': '#1C2B4D',
-        'background': '#FFFFFF',
-        'border': '#E6E6EB',
-    }
+    COLORS = COLORS
 
     def __init__(self, template_dir: str = './templates'):
         self.template_dir = template_dir
-        self.env = Environment(loader=FileSystemLoader(template_dir))
+        # Templates are static at deploy time, so skip the mtime check
+        # and persist compiled bytecode across restarts
+        self.env = Environment(
+            loader=FileSystemLoader(template_dir),
+            bytecode_cache=FileSystemBytecodeCache(),
+            auto_reload=False,
+            cache_size=400,
+        )
+        # Hold the compiled template directly - get_template takes
+        # Jinja's cache lock on every call
+        self._template = self.env.get_template('report_template.html')
+        # The stylesheet doesn't depend on audit data - parse it once
+        # and hand WeasyPrint the same CSS object for every render
+        self._pdf_css = CSS(string=self._get_pdf_styles())
 
     def generate_report(
         self,
@@ -43,7 +78,13 @@ class ReportGenerator:
     ) -> str:
         """Generate PDF report"""
 
-        # Prepare data for template
+        # Charts are written next to the PDF and referenced by filename:
+        # base64-embedding them forces WeasyPrint to decode multi-MB
+        # strings and holds each image in memory twice
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        prefix = os.path.splitext(os.path.basename(output_path))[0]
+        charts = self._generate_charts(audit_data, score_data, output_dir, prefix)
+
         template_data = {
             'audit': audit_data,
             'score': score_data,
@@ -51,224 +92,64 @@ class ReportGenerator:
             'generated_date': datetime.now().strftime('%B %d, %Y'),
             'domain': audit_data.get('domain', ''),
             'url': audit_data.get('url', ''),
-            'charts': self._generate_charts(audit_data, score_data),
+            'charts': charts,
             'colors': self.COLORS,
         }
 
-        # Render HTML from template
-        template = self.env.get_template('report_template.html')
-        html_content = template.render(**template_data)
-
-        # Generate PDF with WeasyPrint
-        HTML(string=html_content, base_url=self.template_dir).write_pdf(
-            output_path,
-            stylesheets=[CSS(string=self._get_pdf_styles())]
-        )
+        # Render HTML from the precompiled template
+        html_content = self._template.render(**template_data)
+
+        # Generate PDF with WeasyPrint, then drop the temp chart files
+        try:
+            HTML(string=html_content, base_url=output_dir).write_pdf(
+                output_path,
+                stylesheets=[self._pdf_css]
+            )
+        finally:
+            for filename in charts.values():
+                try:
+                    os.remove(os.path.join(output_dir, filename))
+                except OSError:
+                    pass
 
         return output_path
 
-    def _generate_charts(self, audit_data: Dict[str, Any], score_data: Dict[str, Any]) -> Dict[str, str]:
-        """Generate all charts as base64 encoded images"""
-        charts = {}
-
-        # Overall score gauge chart
-        charts['score_gauge'] = self._create_score_gauge(score_data['total_score'])
-
-        # Breakdown bar chart
-        charts['breakdown_bar'] = self._create_breakdown_chart(score_data['breakdown'])
-
-        # Performance metrics chart
-        charts['performance'] = self._create_performance_chart(audit_data.get('performance', {}))
-
-        # On-page metrics chart
-        charts['onpage_metrics'] = self._create_onpage_chart(audit_data.get('onpage', {}))
-
-        return charts
-
-    def _create_score_gauge(self, score: int) -> str:
-        """Create circular gauge chart for overall score"""
-        fig, ax = plt.subplots(figsize=(6, 4), subplot_kw=dict(aspect="equal"))
-
-        # Determine color based on score
-        if score >= 80:
-            color = self.COLORS['accent_cyan']
-        elif score >= 60:
-            color = self.COLORS['accent_orange']
+    def _generate_charts(
+        self,
+        audit_data: Dict[str, Any],
+        score_data: Dict[str, Any],
+        output_dir: str,
+        prefix: str
+    ) -> Dict[str, str]:
+        """Generate all charts as PNG files, returning their filenames
+
+        Rendered inline: this already runs inside a pdf_pool worker
+        process, and the Pillow renderers take milliseconds, so fanning
+        out to a nested process pool would cost far more in fork and
+        teardown than the drawing itself.
+        """
+        if USE_MATPLOTLIB_CHARTS:
+            renderers = (_create_score_gauge_mpl, _create_breakdown_chart_mpl,
+                         _create_performance_chart_mpl, _create_onpage_chart_mpl)
         else:
-            color = '#F24444'  # Red
-
-        # Create donut chart
-        sizes = [score, 100 - score]
-        colors_list = [color, self.COLORS['light_100']]
-
-        wedges, texts = ax.pie(
-            sizes,
-            colors=colors_list,
-            startangle=90,
-            counterclock=False,
-            wedgeprops=dict(width=0.5, edgecolor='white')
-        )
-
-        # Add score text in center
-        ax.text(0, 0, f"{score}", ha='center', va='center',
-                fontsize=48, fontweight='bold', color=self.COLORS['text_dark'],
-                fontfamily='sans-serif')
-
-        ax.text(0, -0.3, "Overall Score", ha='center', va='center',
-                fontsize=14, color=self.COLORS['text_dark'],
-                fontfamily='sans-serif')
-
-        plt.tight_layout()
-        return self._fig_to_base64(fig)
-
-    def _create_breakdown_chart(self, breakdown: Dict[str, Any]) -> str:
-        """Create horizontal bar chart for score breakdown"""
-        fig, ax = plt.subplots(figsize=(8, 5))
-
-        categories = []
-        scores = []
-        colors = []
-
-        for category, data in breakdown.items():
-            categories.append(category.replace('_', ' ').title())
-            score = data['score']
-            scores.append(score)
-
-            # Color based on score
-            if score >= 80:
-                colors.append(self.COLORS['accent_cyan'])
-            elif score >= 60:
-                colors.append(self.COLORS['accent_orange'])
-            else:
-                colors.append('#F24444')
-
-        # Create horizontal bars
-        y_pos = range(len(categories))
-        bars = ax.barh(y_pos, scores, color=colors, edgecolor=self.COLORS['border'], linewidth=1)
-
-        # Add value labels
-        for i, (bar, score) in enumerate(zip(bars, scores)):
-            ax.text(score + 2, i, f"{score}/100", va='center',
-                    fontsize=10, color=self.COLORS['text_dark'],
-                    fontfamily='sans-serif')
-
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(categories, fontsize=11, fontfamily='sans-serif')
-        ax.set_xlabel('Score', fontsize=11, fontweight='bold',
-                      color=self.COLORS['text_dark'], fontfamily='sans-serif')
-        ax.set_xlim(0, 110)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.grid(axis='x', alpha=0.3, linestyle='--')
-
-        plt.tight_layout()
-        return self._fig_to_base64(fig)
-
-    def _create_performance_chart(self, performance: Dict[str, Any]) -> str:
-        """Create performance metrics bar chart"""
-        fig, ax = plt.subplots(figsize=(8, 4))
-
-        metrics = {
-            'Load Time': performance.get('load_time_ms', 0) / 1000,  # Convert to seconds
-            'DOM Ready': performance.get('dom_content_loaded_ms', 0) / 1000,
-            'First Paint': performance.get('first_paint_ms', 0) / 1000,
+            renderers = (_create_score_gauge, _create_breakdown_chart,
+                         _create_performance_chart, _create_onpage_chart)
+
+        gauge, breakdown, performance, onpage = renderers
+        tasks = {
+            'score_gauge': (gauge, score_data['total_score']),
+            'breakdown_bar': (breakdown, score_data['breakdown']),
+            'performance': (performance, audit_data.get('performance', {})),
+            'onpage_metrics': (onpage, audit_data.get('onpage', {})),
         }
 
-        categories = list(metrics.keys())
-        values = list(metrics.values())
-
-        # Color based on thresholds
-        colors = []
-        for val in values:
-            if val < 2:
-                colors.append(self.COLORS['accent_cyan'])
-            elif val < 4:
-                colors.append(self.COLORS['accent_orange'])
-            else:
-                colors.append('#F24444')
-
-        bars = ax.bar(categories, values, color=colors, edgecolor=self.COLORS['border'], linewidth=1)
-
-        # Add value labels
-        for bar, val in zip(bars, values):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width() / 2, height + 0.1,
-                    f'{val:.2f}s', ha='center', va='bottom',
-                    fontsize=10, color=self.COLORS['text_dark'],
-                    fontfamily='sans-serif')
-
-        ax.set_ylabel('Seconds', fontsize=11, fontweight='bold',
-                      color=self.COLORS['text_dark'], fontfamily='sans-serif')
-        ax.set_title('Performance Metrics', fontsize=13, fontweight='bold',
-                     color=self.COLORS['text_dark'], pad=15, fontfamily='sans-serif')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-
-        plt.tight_layout()
-        return self._fig_to_base64(fig)
-
-    def _create_onpage_chart(self, onpage: Dict[str, Any]) -> str:
-        """Create on-page optimization metrics"""
-        fig, ax = plt.subplots(figsize=(7, 4))
-
-        metrics = {
-            'Title Length': {
-                'current': onpage.get('title_length', 0),
-                'ideal': 50,
-                'max': 70,
-            },
-            'Meta Desc': {
-                'current': onpage.get('meta_description_length', 0),
-                'ideal': 140,
-                'max': 180,
-            },
-            'Word Count': {
-                'current': min(onpage.get('word_count', 0), 2000),  # Cap at 2000 for visualization
-                'ideal': 1000,
-                'max': 2000,
-            },
-        }
-
-        categories = list(metrics.keys())
-        current_values = [m['current'] for m in metrics.values()]
-        ideal_values = [m['ideal'] for m in metrics.values()]
-
-        x = range(len(categories))
-        width = 0.35
-
-        # Current vs Ideal bars
-        bars1 = ax.bar([i - width/2 for i in x], current_values, width,
-                       label='Current', color=self.COLORS['accent_orange'],
-                       edgecolor=self.COLORS['border'], linewidth=1)
-
-        bars2 = ax.bar([i + width/2 for i in x], ideal_values, width,
-                       label='Ideal', color=self.COLORS['accent_cyan'],
-                       alpha=0.7, edgecolor=self.COLORS['border'], linewidth=1)
-
-        ax.set_xticks(x)
-        ax.set_xticklabels(categories, fontsize=10, fontfamily='sans-serif')
-        ax.set_ylabel('Value', fontsize=11, fontweight='bold',
-                      color=self.COLORS['text_dark'], fontfamily='sans-serif')
-        ax.set_title('On-Page Metrics: Current vs Ideal', fontsize=12, fontweight='bold',
-                     color=self.COLORS['text_dark'], pad=15, fontfamily='sans-serif')
-        ax.legend(fontsize=10, frameon=False)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-
-        plt.tight_layout()
-        return self._fig_to_base64(fig)
-
-    def _fig_to_base64(self, fig) -> str:
-        """Convert matplotlib figure to base64 string"""
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', dpi=150, bbox_inches='tight',
-                    facecolor='white', edgecolor='none')
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close(fig)
-        return f"data:image/png;base64,{img_base64}"
+        charts = {}
+        for name, (fn, arg) in tasks.items():
+            filename = f"{prefix}_{name}.png"
+            with open(os.path.join(output_dir, filename), 'wb') as fh:
+                fh.write(fn(arg))
+            charts[name] = filename
+        return charts
 
     def _get_pdf_styles(self) -> str:
         """Get CSS styles for PDF"""
@@ -465,6 +346,333 @@ class ReportGenerator:
         """
 
 
+# Chart renderers, drawing from the module COLORS palette
+
+def _font(size: int) -> ImageFont.ImageFont:
+    """Load the bundled default font at the requested size"""
+    return ImageFont.load_default(size)
+
+
+def _text_centered(draw, xy, text, size, fill, anchor='mm'):
+    draw.text(xy, text, font=_font(size), fill=fill, anchor=anchor)
+
+
+def _img_to_png(img: Image.Image) -> bytes:
+    """Encode a Pillow image as PNG bytes"""
+    buf = io.BytesIO()
+    img.save(buf, 'PNG', optimize=False, compress_level=1)
+    return buf.getvalue()
+
+
+def _create_score_gauge(score: int) -> bytes:
+    """Create circular gauge chart for overall score"""
+    img = Image.new('RGB', (600, 400), COLORS['background'])
+    draw = ImageDraw.Draw(img)
+    color = _score_color(score)
+
+    # Donut: full track, score arc, then punch the hole
+    box = (160, 60, 440, 340)
+    draw.ellipse(box, fill=COLORS['light_100'])
+    draw.pieslice(box, -90, -90 + score * 3.6, fill=color)
+    draw.ellipse((230, 130, 370, 270), fill=COLORS['background'])
+
+    _text_centered(draw, (300, 185), str(score), 64, COLORS['text_dark'])
+    _text_centered(draw, (300, 245), "Overall Score", 20, COLORS['text_dark'])
+
+    return _img_to_png(img)
+
+
+def _create_breakdown_chart(breakdown: Dict[str, Any]) -> bytes:
+    """Create horizontal bar chart for score breakdown"""
+    rows = [(category.replace('_', ' ').title(), data['score'])
+            for category, data in breakdown.items()]
+
+    row_h = 70
+    img = Image.new('RGB', (800, 60 + row_h * len(rows)), COLORS['background'])
+    draw = ImageDraw.Draw(img)
+
+    left, right = 200, 700  # bar area; 0-100 maps onto its width
+    for i, (label, score) in enumerate(rows):
+        top = 40 + i * row_h
+        bar_w = (right - left) * score / 100
+        _text_centered(draw, (left - 15, top + 15), label, 16,
+                       COLORS['text_dark'], anchor='rm')
+        draw.rectangle((left, top, left + bar_w, top + 30),
+                       fill=_score_color(score), outline=COLORS['border'])
+        _text_centered(draw, (left + bar_w + 10, top + 15), f"{score}/100", 14,
+                       COLORS['text_dark'], anchor='lm')
+
+    return _img_to_png(img)
+
+
+def _create_performance_chart(performance: Dict[str, Any]) -> bytes:
+    """Create performance metrics bar chart"""
+    metrics = {
+        'Load Time': performance.get('load_time_ms', 0) / 1000,  # Convert to seconds
+        'DOM Ready': performance.get('dom_content_loaded_ms', 0) / 1000,
+        'First Paint': performance.get('first_paint_ms', 0) / 1000,
+    }
+
+    img = Image.new('RGB', (800, 400), COLORS['background'])
+    draw = ImageDraw.Draw(img)
+    _text_centered(draw, (400, 30), "Performance Metrics", 20, COLORS['text_dark'])
+
+    floor, top_y = 340, 80
+    scale = (floor - top_y) / max(max(metrics.values()), 1.0)
+    bar_w, gap = 140, 80
+
+    for i, (label, val) in enumerate(metrics.items()):
+        x0 = 100 + i * (bar_w + gap)
+        height = val * scale
+        # Thresholds: under 2s is healthy, under 4s borderline
+        color = _score_color(4 - val, good=2, warn=0)
+        draw.rectangle((x0, floor - height, x0 + bar_w, floor),
+                       fill=color, outline=COLORS['border'])
+        _text_centered(draw, (x0 + bar_w / 2, floor - height - 15),
+                       f"{val:.2f}s", 14, COLORS['text_dark'])
+        _text_centered(draw, (x0 + bar_w / 2, floor + 20), label, 15,
+                       COLORS['text_dark'])
+
+    return _img_to_png(img)
+
+
+def _create_onpage_chart(onpage: Dict[str, Any]) -> bytes:
+    """Create on-page optimization metrics"""
+    metrics = {
+        'Title Length': (onpage.get('title_length', 0), 50),
+        'Meta Desc': (onpage.get('meta_description_length', 0), 140),
+        'Word Count': (min(onpage.get('word_count', 0), 2000), 1000),  # Cap at 2000 for visualization
+    }
+
+    img = Image.new('RGB', (700, 400), COLORS['background'])
+    draw = ImageDraw.Draw(img)
+    _text_centered(draw, (350, 30), "On-Page Metrics: Current vs Ideal", 18,
+                   COLORS['text_dark'])
+
+    floor, top_y = 330, 80
+    peak = max(max(current, ideal) for current, ideal in metrics.values())
+    scale = (floor - top_y) / max(peak, 1)
+    bar_w, gap = 60, 80
+
+    for i, (label, (current, ideal)) in enumerate(metrics.items()):
+        x0 = 80 + i * (2 * bar_w + gap)
+        for offset, value, color in ((0, current, COLORS['accent_orange']),
+                                     (bar_w, ideal, COLORS['accent_cyan'])):
+            height = value * scale
+            draw.rectangle((x0 + offset, floor - height,
+                            x0 + offset + bar_w, floor),
+                           fill=color, outline=COLORS['border'])
+        _text_centered(draw, (x0 + bar_w, floor + 20), label, 14,
+                       COLORS['text_dark'])
+
+    # Legend
+    draw.rectangle((480, 70, 495, 85), fill=COLORS['accent_orange'])
+    _text_centered(draw, (505, 77), "Current", 13, COLORS['text_dark'], anchor='lm')
+    draw.rectangle((480, 95, 495, 110), fill=COLORS['accent_cyan'])
+    _text_centered(draw, (505, 102), "Ideal", 13, COLORS['text_dark'], anchor='lm')
+
+    return _img_to_png(img)
+
+
+# One Figure per worker process, cleared between charts - skips the
+# per-call Figure/Axes/Canvas allocation
+_mpl_fig = None
+
+
+def _get_mpl_fig(figsize) -> Figure:
+    global _mpl_fig
+    if _mpl_fig is None:
+        _mpl_fig = Figure(figsize=figsize)
+        FigureCanvasAgg(_mpl_fig)
+    else:
+        _mpl_fig.clear()
+        _mpl_fig.set_size_inches(*figsize)
+    return _mpl_fig
+
+
+def _create_score_gauge_mpl(score: int) -> bytes:
+    """Create circular gauge chart for overall score (matplotlib fallback)"""
+    fig = _get_mpl_fig((6, 4))
+    ax = fig.add_subplot(111, aspect="equal")
+
+    color = _score_color(score)
+
+    # Create donut chart
+    sizes = [score, 100 - score]
+    colors_list = [color, COLORS['light_100']]
+
+    wedges, texts = ax.pie(
+        sizes,
+        colors=colors_list,
+        startangle=90,
+        counterclock=False,
+        wedgeprops=dict(width=0.5, edgecolor='white')
+    )
+
+    # Add score text in center
+    ax.text(0, 0, f"{score}", ha='center', va='center',
+            fontsize=48, fontweight='bold', color=COLORS['text_dark'],
+            fontfamily='sans-serif')
+
+    ax.text(0, -0.3, "Overall Score", ha='center', va='center',
+            fontsize=14, color=COLORS['text_dark'],
+            fontfamily='sans-serif')
+
+    fig.tight_layout()
+    return _fig_to_png(fig)
+
+
+def _create_breakdown_chart_mpl(breakdown: Dict[str, Any]) -> bytes:
+    """Create horizontal bar chart for score breakdown (matplotlib fallback)"""
+    fig = _get_mpl_fig((8, 5))
+    ax = fig.add_subplot(111)
+
+    categories = []
+    scores = []
+    colors = []
+
+    for category, data in breakdown.items():
+        categories.append(category.replace('_', ' ').title())
+        score = data['score']
+        scores.append(score)
+        colors.append(_score_color(score))
+
+    # Create horizontal bars
+    y_pos = range(len(categories))
+    bars = ax.barh(y_pos, scores, color=colors, edgecolor=COLORS['border'], linewidth=1)
+
+    # Add value labels
+    for i, (bar, score) in enumerate(zip(bars, scores)):
+        ax.text(score + 2, i, f"{score}/100", va='center',
+                fontsize=10, color=COLORS['text_dark'],
+                fontfamily='sans-serif')
+
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(categories, fontsize=11, fontfamily='sans-serif')
+    ax.set_xlabel('Score', fontsize=11, fontweight='bold',
+                  color=COLORS['text_dark'], fontfamily='sans-serif')
+    ax.set_xlim(0, 110)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.grid(axis='x', alpha=0.3, linestyle='--')
+
+    fig.tight_layout()
+    return _fig_to_png(fig)
+
+
+def _create_performance_chart_mpl(performance: Dict[str, Any]) -> bytes:
+    """Create performance metrics bar chart (matplotlib fallback)"""
+    fig = _get_mpl_fig((8, 4))
+    ax = fig.add_subplot(111)
+
+    metrics = {
+        'Load Time': performance.get('load_time_ms', 0) / 1000,  # Convert to seconds
+        'DOM Ready': performance.get('dom_content_loaded_ms', 0) / 1000,
+        'First Paint': performance.get('first_paint_ms', 0) / 1000,
+    }
+
+    categories = list(metrics.keys())
+    values = list(metrics.values())
+
+    # Color based on thresholds
+    colors = [_score_color(4 - val, good=2, warn=0) for val in values]
+
+    bars = ax.bar(categories, values, color=colors, edgecolor=COLORS['border'], linewidth=1)
+
+    # Add value labels
+    for bar, val in zip(bars, values):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width() / 2, height + 0.1,
+                f'{val:.2f}s', ha='center', va='bottom',
+                fontsize=10, color=COLORS['text_dark'],
+                fontfamily='sans-serif')
+
+    ax.set_ylabel('Seconds', fontsize=11, fontweight='bold',
+                  color=COLORS['text_dark'], fontfamily='sans-serif')
+    ax.set_title('Performance Metrics', fontsize=13, fontweight='bold',
+                 color=COLORS['text_dark'], pad=15, fontfamily='sans-serif')
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+    fig.tight_layout()
+    return _fig_to_png(fig)
+
+
+def _create_onpage_chart_mpl(onpage: Dict[str, Any]) -> bytes:
+    """Create on-page optimization metrics (matplotlib fallback)"""
+    fig = _get_mpl_fig((7, 4))
+    ax = fig.add_subplot(111)
+
+    metrics = {
+        'Title Length': {
+            'current': onpage.get('title_length', 0),
+            'ideal': 50,
+            'max': 70,
+        },
+        'Meta Desc': {
+            'current': onpage.get('meta_description_length', 0),
+            'ideal': 140,
+            'max': 180,
+        },
+        'Word Count': {
+            'current': min(onpage.get('word_count', 0), 2000),  # Cap at 2000 for visualization
+            'ideal': 1000,
+            'max': 2000,
+        },
+    }
+
+    categories = list(metrics.keys())
+    current_values = [m['current'] for m in metrics.values()]
+    ideal_values = [m['ideal'] for m in metrics.values()]
+
+    x = range(len(categories))
+    width = 0.35
+
+    # Current vs Ideal bars
+    bars1 = ax.bar([i - width/2 for i in x], current_values, width,
+                   label='Current', color=COLORS['accent_orange'],
+                   edgecolor=COLORS['border'], linewidth=1)
+
+    bars2 = ax.bar([i + width/2 for i in x], ideal_values, width,
+                   label='Ideal', color=COLORS['accent_cyan'],
+                   alpha=0.7, edgecolor=COLORS['border'], linewidth=1)
+
+    ax.set_xticks(x)
+    ax.set_xticklabels(categories, fontsize=10, fontfamily='sans-serif')
+    ax.set_ylabel('Value', fontsize=11, fontweight='bold',
+                  color=COLORS['text_dark'], fontfamily='sans-serif')
+    ax.set_title('On-Page Metrics: Current vs Ideal', fontsize=12, fontweight='bold',
+                 color=COLORS['text_dark'], pad=15, fontfamily='sans-serif')
+    ax.legend(fontsize=10, frameon=False)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+    fig.tight_layout()
+    return _fig_to_png(fig)
+
+
+def _fig_to_png(fig) -> bytes:
+    """Convert matplotlib figure to PNG bytes
+
+    96 DPI and zlib level 1: deeper PNG compression is almost pure CPU
+    for marginal size savings.
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=96, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1, 'optimize': False})
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_generator(template_dir: str) -> ReportGenerator:
+    """Process-wide generator cache - keeps the compiled Jinja
+    environment alive across reports instead of rebuilding it per PDF"""
+    return ReportGenerator(template_dir)
+
+
 def generate_pdf_report(
     audit_data: Dict[str, Any],
     score_data: Dict[str, Any],
@@ -473,5 +681,25 @@ def generate_pdf_report(
     template_dir: str = './templates'
 ) -> str:
     """Convenience function to generate PDF report"""
-    generator = ReportGenerator(template_dir)
+    generator = _get_generator(template_dir)
     return generator.generate_report(audit_data, score_data, output_path, report_type)
+
+
+async def generate_pdf_report_async(
+    audit_data: Dict[str, Any],
+    score_data: Dict[str, Any],
+    output_path: str,
+    report_type: str = 'free',
+    template_dir: str = './templates'
+) -> str:
+    """Render a PDF without stalling the event loop
+
+    WeasyPrint spends most of its time in cffi/cairo where the GIL is
+    released, so a worker thread lets other coroutines progress. The
+    web app routes through its own process pool instead for multi-core
+    throughput; this is for async callers without one.
+    """
+    return await asyncio.to_thread(
+        generate_pdf_report, audit_data, score_data, output_path,
+        report_type, template_dir
+    )
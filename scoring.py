@@ -2,32 +2,511 @@
 SEO Scoring Algorithm
 Transparent, weighted scoring system (0-100)
 """
-from typing import Dict, Any, List
+import hashlib
+import operator
+import struct
+import types
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import chain, islice
+from typing import Dict, Any, List, Mapping
+
+# Threshold ladders as (cut points, scores-per-interval) pairs indexed
+# via bisect: one C call instead of an if/elif chain per metric.
+# bisect_right puts a value equal to a cut point into the next bucket,
+# which preserves the original < / >= boundary semantics.
+SPEED_THRESHOLDS = (2000, 3000, 5000, 7000)
+SPEED_SCORES = (25, 20, 15, 10, 5)
+
+LCP_THRESHOLDS = (2500, 4000)
+LCP_SCORES = (8, 5, 2)
+
+CLS_THRESHOLDS = (0.1, 0.25)
+CLS_SCORES = (7, 4, 1)
+
+WORD_THRESHOLDS = (300, 500, 1000, 1500)
+WORD_SCORES = (4, 8, 12, 16, 20)
+
+ALT_THRESHOLDS = (30, 50, 70, 90)
+ALT_SCORES = (2, 5, 8, 12, 15)
+
+INTERNAL_THRESHOLDS = (1, 3, 5, 10)
+INTERNAL_SCORES = (0, 5, 10, 15, 20)
+
+# Title/description score by length band: ideal range in the middle,
+# tapering off on both sides
+TITLE_THRESHOLDS = (1, 20, 30, 61, 71)
+TITLE_SCORES = (0, 5, 10, 15, 10, 5)
+
+DESC_THRESHOLDS = (1, 100, 120, 161, 181)
+DESC_SCORES = (0, 5, 10, 15, 10, 5)
+
+GRADE_THRESHOLDS = (60, 70, 80, 90)
+GRADES = ('F', 'D', 'C', 'B', 'A')
+
+# Frozen priority ranking; the integer _prio injected into each
+# template below derives from it so sort order has one source of truth
+_PRIORITY_ORDER: Mapping[str, int] = types.MappingProxyType({
+    'critical': 0,
+    'high': 1,
+    'medium': 2,
+    'low': 3,
+})
+
+# Recommendation templates shared across audits. Read-only proxies are
+# appended as-is; rules whose issue text needs interpolation
+# shallow-copy theirs at emit time.
+_REC_TEMPLATE_DATA = {
+    'no_https': {
+        'priority': 'critical',
+        'category': 'Technical',
+        'issue': 'No HTTPS/SSL Certificate',
+        'recommendation': 'Install an SSL certificate to enable HTTPS. This is critical for security and SEO.',
+    },
+    'not_mobile': {
+        'priority': 'critical',
+        'category': 'Technical',
+        'issue': 'Not Mobile Responsive',
+        'recommendation': 'Implement responsive design with proper viewport meta tag. Mobile-first indexing requires mobile optimization.',
+    },
+    'slow_load': {
+        'priority': 'high',
+        'category': 'Performance',
+        'issue': 'Slow Page Load',
+        'recommendation': 'Optimize images, enable caching, minimize CSS/JS, and use a CDN to improve load times.',
+    },
+    'no_sitemap': {
+        'priority': 'high',
+        'category': 'Technical',
+        'issue': 'No XML Sitemap',
+        'recommendation': 'Create and submit an XML sitemap to help search engines discover your pages.',
+    },
+    'missing_title': {
+        'priority': 'critical',
+        'category': 'On-Page',
+        'issue': 'Missing Title Tag',
+        'recommendation': 'Add a unique, descriptive title tag (30-60 characters) to every page.',
+    },
+    'title_length': {
+        'priority': 'medium',
+        'category': 'On-Page',
+        'issue': 'Title Tag Length',
+        'recommendation': 'Optimize title tag length to 30-60 characters for better SERP display.',
+    },
+    'missing_meta': {
+        'priority': 'high',
+        'category': 'On-Page',
+        'issue': 'Missing Meta Description',
+        'recommendation': 'Add a compelling meta description (120-160 characters) to improve click-through rates.',
+    },
+    'images_alt': {
+        'priority': 'medium',
+        'category': 'On-Page',
+        'issue': 'Images Missing Alt Text',
+        'recommendation': 'Add descriptive alt text to all images for accessibility and SEO.',
+    },
+    'thin_content': {
+        'priority': 'high',
+        'category': 'Content',
+        'issue': 'Thin Content',
+        'recommendation': 'Add more high-quality, relevant content. Aim for at least 500-1000 words for better rankings.',
+    },
+    'not_ranking': {
+        'priority': 'medium',
+        'category': 'Competitive',
+        'issue': 'Not Ranking in Top 10',
+        'recommendation': 'Analyze top-ranking competitors and improve content quality.',
+    },
+}
+
+REC_TEMPLATES: Dict[str, Mapping[str, Any]] = {
+    key: types.MappingProxyType({'_prio': _PRIORITY_ORDER[t['priority']], **t})
+    for key, t in _REC_TEMPLATE_DATA.items()
+}
+
+
+# Weight distribution
+TECHNICAL_WEIGHT = 40
+ONPAGE_WEIGHT = 40
+COMPETITIVE_WEIGHT = 20
+
+# Flat fields read by _score_technical, pulled in one itemgetter call
+# against a defaults-merged dict instead of repeated .get lookups
+_TECH_DEFAULTS = {
+    'https': False,
+    'mobile_responsive': False,
+    'robots_txt_exists': False,
+    'sitemap_exists': False,
+    'canonical': None,
+}
+_TECH_GET = operator.itemgetter(*_TECH_DEFAULTS)
+
+_PERF_DEFAULTS = {
+    'load_time_ms': 10000,
+    'lcp': 5000,
+    'cls': 1,
+}
+_PERF_GET = operator.itemgetter(*_PERF_DEFAULTS)
+
+
+def _weighted_total(technical_score: int, onpage_score: int,
+                    competitive_score: int) -> int:
+    """Weighted 0-100 total in pure integer arithmetic
+
+    The 40/40/20 weights reduce to (2t + 2o + c) / 5; adding 2 before
+    the floor division rounds remainders of 3 and 4 up, matching what
+    round() produced with the float formula (the fractional part is
+    always a fifth, never exactly .5, so banker's rounding never
+    applied).
+    """
+    return (technical_score * 2 + onpage_score * 2 + competitive_score + 2) // 5
+
+
+def _score_technical(technical: Dict[str, Any], performance: Dict[str, Any],
+                     breakdown: Dict[str, Any]) -> int:
+    """Score Technical SEO (0-100)"""
+    scores: Dict[str, int] = {}
+
+    https, mobile, robots_txt, sitemap, canonical = _TECH_GET(
+        {**_TECH_DEFAULTS, **technical})
+
+    # SSL/HTTPS (5 points)
+    scores['https'] = 5 if https else 0
+
+    # Mobile Responsive (10 points)
+    scores['mobile'] = 10 if mobile else 0
+
+    # Robots.txt (5 points)
+    scores['robots_txt'] = 5 if robots_txt else 0
+
+    # XML Sitemap (5 points)
+    scores['sitemap'] = 5 if sitemap else 0
+
+    # Schema Markup (5 points)
+    schema = technical.get('schema_markup', {})
+    scores['schema'] = 5 if schema.get('has_schema', False) else 0
+
+    # Heading Structure (10 points)
+    headings = technical.get('headings', {})
+    h1_score = 10 if headings.get('has_proper_hierarchy', False) else 5 if headings.get('h1_count', 0) > 0 else 0
+    scores['headings'] = h1_score
+
+    # Canonical Tag (5 points)
+    scores['canonical'] = 5 if canonical else 0
+
+    # Page Speed (25 points) and Core Web Vitals (15 points)
+    load_time, lcp, cls = _PERF_GET({**_PERF_DEFAULTS, **performance})
+
+    scores['speed'] = SPEED_SCORES[bisect_right(SPEED_THRESHOLDS, load_time)]
+    scores['lcp'] = LCP_SCORES[bisect_right(LCP_THRESHOLDS, lcp)]
+    scores['cls'] = CLS_SCORES[bisect_right(CLS_THRESHOLDS, cls)]
+
+    # Broken Links (15 points)
+    broken = technical.get('broken_links', {})
+    broken_count = broken.get('broken_count', 0)
+    broken_score = 15 if broken_count == 0 else max(0, 15 - (broken_count * 3))
+    scores['broken_links'] = broken_score
+
+    breakdown['technical'] = scores
+    return sum(scores.values())
+
+
+def _score_onpage(onpage: Dict[str, Any], title_length: int, desc_length: int,
+                  breakdown: Dict[str, Any]) -> int:
+    """Score On-Page SEO (0-100)"""
+    scores: Dict[str, int] = {}
+
+    # Title Tag (15 points)
+    scores['title'] = TITLE_SCORES[bisect_right(TITLE_THRESHOLDS, title_length)]
+
+    # Meta Description (15 points)
+    scores['meta_description'] = DESC_SCORES[bisect_right(DESC_THRESHOLDS, desc_length)]
+
+    # Content Quality (20 points)
+    word_count = onpage.get('word_count', 0)
+    scores['content'] = WORD_SCORES[bisect_right(WORD_THRESHOLDS, word_count)]
+
+    # Image Optimization (15 points)
+    images = onpage.get('images', {})
+    alt_percentage = images.get('alt_percentage', 0)
+    scores['images'] = ALT_SCORES[bisect_right(ALT_THRESHOLDS, alt_percentage)]
+
+    # Internal Linking (20 points)
+    internal_links = onpage.get('internal_links', {}).get('count', 0)
+    scores['internal_links'] = INTERNAL_SCORES[bisect_right(INTERNAL_THRESHOLDS, internal_links)]
+
+    # URL Structure (15 points)
+    url_struct = onpage.get('url_structure', {})
+    url_length = url_struct.get('length', 100)
+    uses_hyphens = url_struct.get('uses_hyphens', False)
+    path_depth = url_struct.get('path_depth', 5)
+
+    url_score = 15
+    if url_length > 100:
+        url_score -= 5
+    if not uses_hyphens and path_depth > 0:
+        url_score -= 3
+    if path_depth > 4:
+        url_score -= 4
+
+    scores['url_structure'] = max(0, url_score)
+
+    breakdown['onpage'] = scores
+    return sum(scores.values())
+
+
+def _score_competitive(competitors: Dict[str, Any], title_length: int,
+                       desc_length: int, breakdown: Dict[str, Any]) -> int:
+    """Score Competitive Position (0-100)"""
+    if not competitors or 'error' in competitors:
+        # No competitive data available
+        return 50  # Neutral score
+
+    scores: Dict[str, int] = {}
+
+    # Current SERP Position (40 points)
+    position = competitors.get('current_position')
+
+    if position:
+        if position == 1:
+            position_score = 40
+        elif position <= 3:
+            position_score = 35
+        elif position <= 5:
+            position_score = 30
+        elif position <= 10:
+            position_score = 20
+        else:
+            position_score = 10
+    else:
+        position_score = 5  # Not ranking in top 10
+
+    scores['serp_position'] = position_score
+
+    # Competitive Meta Analysis (60 points)
+    top_competitors = competitors.get('top_competitors', [])
+
+    if top_competitors:
+        # Average both lengths in one pass over the list
+        title_total = 0
+        desc_total = 0
+        for c in top_competitors:
+            title_total += c.get('title_length', 0)
+            desc_total += c.get('description_length', 0)
+        avg_comp_title_length = title_total / len(top_competitors)
+        avg_comp_desc_length = desc_total / len(top_competitors)
+
+        # Compare title length
+        if 30 <= title_length <= 60 and abs(title_length - avg_comp_title_length) < 20:
+            title_comp_score = 30
+        elif title_length > 0:
+            title_comp_score = 20
+        else:
+            title_comp_score = 5
+
+        scores['title_competitiveness'] = title_comp_score
+
+        # Compare description length
+        if 120 <= desc_length <= 160 and abs(desc_length - avg_comp_desc_length) < 30:
+            desc_comp_score = 30
+        elif desc_length > 0:
+            desc_comp_score = 20
+        else:
+            desc_comp_score = 5
+
+        scores['description_competitiveness'] = desc_comp_score
+    else:
+        scores['title_competitiveness'] = 25
+        scores['description_competitiveness'] = 25
+
+    breakdown['competitive'] = scores
+    return sum(scores.values())
+
+
+def _get_grade(score: int) -> str:
+    """Convert score to letter grade"""
+    return GRADES[bisect_right(GRADE_THRESHOLDS, score)]
+
+
+def _generate_recommendations(technical: Dict[str, Any],
+                              performance: Dict[str, Any],
+                              onpage: Dict[str, Any],
+                              competitors: Dict[str, Any],
+                              title_length: int,
+                              desc_length: int) -> List[Dict[str, str]]:
+    """Generate prioritized recommendations based on audit findings
+
+    One generator per priority tier, chained in rank order, so the
+    result is sorted by construction; islice caps it at 10 and stops
+    evaluating rules (and interpolating issue text) once the cap is hit.
+    Every rule emits a plain-dict shallow copy of its template: the
+    result is pickled into the PDF worker pool, which rejects the
+    read-only proxy objects themselves.
+    """
+    def critical():
+        if not technical.get('https', False):
+            yield dict(REC_TEMPLATES['no_https'])
+        if not technical.get('mobile_responsive', False):
+            yield dict(REC_TEMPLATES['not_mobile'])
+        if title_length == 0:
+            yield dict(REC_TEMPLATES['missing_title'])
+
+    def high():
+        if not technical.get('sitemap_exists', False):
+            yield dict(REC_TEMPLATES['no_sitemap'])
+        if desc_length == 0:
+            yield dict(REC_TEMPLATES['missing_meta'])
+        load_ms = performance.get('load_time_ms', 0)
+        if load_ms > 3000:
+            yield {
+                **REC_TEMPLATES['slow_load'],
+                'issue': f"Slow Page Load ({load_ms}ms)",
+            }
+        word_count = onpage.get('word_count', 0)
+        if word_count < 300:
+            yield {
+                **REC_TEMPLATES['thin_content'],
+                'issue': f"Thin Content ({word_count} words)",
+            }
+
+    def medium():
+        if 0 < title_length < 30 or title_length > 60:
+            yield {
+                **REC_TEMPLATES['title_length'],
+                'issue': f"Title Tag Length ({title_length} chars)",
+            }
+        images_without_alt = onpage.get('images', {}).get('images_without_alt', 0)
+        if images_without_alt > 0:
+            yield {
+                **REC_TEMPLATES['images_alt'],
+                'issue': f"{images_without_alt} Images Missing Alt Text",
+            }
+        if (competitors and not competitors.get('error')
+                and not competitors.get('current_position')):
+            yield {
+                **REC_TEMPLATES['not_ranking'],
+                'recommendation': f"Target keyword '{competitors.get('keyword')}' - Analyze top-ranking competitors and improve content quality.",
+            }
+
+    return list(islice(chain(critical(), high(), medium()), 10))
 
 
 class SEOScorer:
-    """Calculate SEO score based on audit results"""
+    """Calculate SEO score based on audit results
 
-    # Weight distribution
-    TECHNICAL_WEIGHT = 40
-    ONPAGE_WEIGHT = 40
-    COMPETITIVE_WEIGHT = 20
+    Thin wrapper over the module-level score functions: it resolves the
+    audit sub-dicts once and threads them (plus the shared breakdown
+    dict) through the free functions, which keeps the scoring logic
+    flat and individually callable.
+    """
+
+    __slots__ = ('audit_data', 'breakdown', '_tech', '_on', '_perf',
+                 '_comp', '_title_length', '_desc_length')
+
+    # Class-level aliases kept for existing callers
+    TECHNICAL_WEIGHT = TECHNICAL_WEIGHT
+    ONPAGE_WEIGHT = ONPAGE_WEIGHT
+    COMPETITIVE_WEIGHT = COMPETITIVE_WEIGHT
 
     def __init__(self, audit_data: Dict[str, Any]):
         self.audit_data = audit_data
         self.breakdown = {}
+        # The sub-dicts and the two lengths read by several score
+        # functions are resolved once here
+        self._tech = audit_data.get('technical') or {}
+        self._on = audit_data.get('onpage') or {}
+        self._perf = audit_data.get('performance') or {}
+        self._comp = audit_data.get('competitors') or {}
+        self._title_length = self._on.get('title_length', 0)
+        self._desc_length = self._on.get('meta_description_length', 0)
+
+    @classmethod
+    def from_batch(cls, audits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Score a batch of audits through the compiled kernels
+
+        Flattens the numeric fields into structure-of-arrays NumPy
+        inputs and runs the numba kernels in scoring_numba over the
+        whole batch; competitive scoring stays per-dict since it walks
+        nested competitor lists. Returns one summary dict per audit.
+        """
+        import numpy as np
+        from scoring_numba import _score_onpage_vec, _score_technical_vec
+
+        n = len(audits)
+        tech = [a.get('technical') or {} for a in audits]
+        perf = [a.get('performance') or {} for a in audits]
+        onpage = [a.get('onpage') or {} for a in audits]
+
+        def col(dicts, key, default, dtype):
+            return np.fromiter((d.get(key, default) for d in dicts),
+                               dtype=dtype, count=n)
+
+        technical_scores = _score_technical_vec(
+            col(tech, 'https', False, np.bool_),
+            col(tech, 'mobile_responsive', False, np.bool_),
+            col(tech, 'robots_txt_exists', False, np.bool_),
+            col(tech, 'sitemap_exists', False, np.bool_),
+            np.fromiter(((t.get('schema_markup') or {}).get('has_schema', False)
+                         for t in tech), dtype=np.bool_, count=n),
+            np.fromiter(((t.get('headings') or {}).get('h1_count', 0)
+                         for t in tech), dtype=np.int32, count=n),
+            np.fromiter(((t.get('headings') or {}).get('has_proper_hierarchy', False)
+                         for t in tech), dtype=np.bool_, count=n),
+            np.fromiter((bool(t.get('canonical')) for t in tech),
+                        dtype=np.bool_, count=n),
+            col(perf, 'load_time_ms', 10000, np.int64),
+            col(perf, 'lcp', 5000, np.float64),
+            col(perf, 'cls', 1, np.float64),
+            np.fromiter(((t.get('broken_links') or {}).get('broken_count', 0)
+                         for t in tech), dtype=np.int32, count=n),
+        )
+
+        onpage_scores = _score_onpage_vec(
+            col(onpage, 'title_length', 0, np.int32),
+            col(onpage, 'meta_description_length', 0, np.int32),
+            col(onpage, 'word_count', 0, np.int32),
+            np.fromiter(((o.get('images') or {}).get('alt_percentage', 0)
+                         for o in onpage), dtype=np.float64, count=n),
+            np.fromiter(((o.get('internal_links') or {}).get('count', 0)
+                         for o in onpage), dtype=np.int32, count=n),
+            np.fromiter(((o.get('url_structure') or {}).get('length', 100)
+                         for o in onpage), dtype=np.int32, count=n),
+            np.fromiter(((o.get('url_structure') or {}).get('uses_hyphens', False)
+                         for o in onpage), dtype=np.bool_, count=n),
+            np.fromiter(((o.get('url_structure') or {}).get('path_depth', 5)
+                         for o in onpage), dtype=np.int32, count=n),
+        )
+
+        results = []
+        for i, audit in enumerate(audits):
+            scorer = cls(audit)
+            technical_score = int(technical_scores[i])
+            onpage_score = int(onpage_scores[i])
+            competitive_score = scorer._score_competitive()
+            total_score = _weighted_total(technical_score, onpage_score,
+                                          competitive_score)
+            results.append({
+                'total_score': total_score,
+                'grade': scorer._get_grade(total_score),
+                'technical_score': technical_score,
+                'onpage_score': onpage_score,
+                'competitive_score': competitive_score,
+            })
+        return results
 
     def calculate_score(self) -> Dict[str, Any]:
         """Calculate overall SEO score with breakdown"""
         technical_score = self._score_technical()
         onpage_score = self._score_onpage()
-        competitive_score = self._score_competitive()
+        # Skip the competitive pass entirely when there is no usable
+        # data; _score_competitive would return the same neutral 50
+        if not self._comp or 'error' in self._comp:
+            competitive_score = 50
+        else:
+            competitive_score = self._score_competitive()
 
-        total_score = round(
-            (technical_score * self.TECHNICAL_WEIGHT / 100) +
-            (onpage_score * self.ONPAGE_WEIGHT / 100) +
-            (competitive_score * self.COMPETITIVE_WEIGHT / 100)
-        )
+        total_score = _weighted_total(technical_score, onpage_score,
+                                      competitive_score)
 
         return {
             'total_score': total_score,
@@ -53,350 +532,99 @@ class SEOScorer:
         }
 
     def _score_technical(self) -> int:
-        """Score Technical SEO (0-100)"""
-        technical = self.audit_data.get('technical', {})
-        performance = self.audit_data.get('performance', {})
-
-        scores = {}
-
-        # SSL/HTTPS (5 points)
-        scores['https'] = 5 if technical.get('https', False) else 0
-
-        # Mobile Responsive (10 points)
-        scores['mobile'] = 10 if technical.get('mobile_responsive', False) else 0
-
-        # Robots.txt (5 points)
-        scores['robots_txt'] = 5 if technical.get('robots_txt_exists', False) else 0
-
-        # XML Sitemap (5 points)
-        scores['sitemap'] = 5 if technical.get('sitemap_exists', False) else 0
-
-        # Schema Markup (5 points)
-        schema = technical.get('schema_markup', {})
-        scores['schema'] = 5 if schema.get('has_schema', False) else 0
-
-        # Heading Structure (10 points)
-        headings = technical.get('headings', {})
-        h1_score = 10 if headings.get('has_proper_hierarchy', False) else 5 if headings.get('h1_count', 0) > 0 else 0
-        scores['headings'] = h1_score
-
-        # Canonical Tag (5 points)
-        scores['canonical'] = 5 if technical.get('canonical') else 0
-
-        # Page Speed (25 points)
-        load_time = performance.get('load_time_ms', 10000)
-        if load_time < 2000:
-            speed_score = 25
-        elif load_time < 3000:
-            speed_score = 20
-        elif load_time < 5000:
-            speed_score = 15
-        elif load_time < 7000:
-            speed_score = 10
-        else:
-            speed_score = 5
-        scores['speed'] = speed_score
-
-        # Core Web Vitals (15 points)
-        lcp = performance.get('lcp', 5000)
-        cls = performance.get('cls', 1)
-
-        lcp_score = 8 if lcp < 2500 else 5 if lcp < 4000 else 2
-        cls_score = 7 if cls < 0.1 else 4 if cls < 0.25 else 1
-        scores['lcp'] = lcp_score
-        scores['cls'] = cls_score
-
-        # Broken Links (15 points)
-        broken = technical.get('broken_links', {})
-        broken_count = broken.get('broken_count', 0)
-        broken_score = 15 if broken_count == 0 else max(0, 15 - (broken_count * 3))
-        scores['broken_links'] = broken_score
-
-        self.breakdown['technical'] = scores
-        return sum(scores.values())
+        return _score_technical(self._tech, self._perf, self.breakdown)
 
     def _score_onpage(self) -> int:
-        """Score On-Page SEO (0-100)"""
-        onpage = self.audit_data.get('onpage', {})
-
-        scores = {}
-
-        # Title Tag (15 points)
-        title = onpage.get('title', '')
-        title_length = onpage.get('title_length', 0)
-
-        if 30 <= title_length <= 60:
-            title_score = 15
-        elif 20 <= title_length <= 70:
-            title_score = 10
-        elif title_length > 0:
-            title_score = 5
-        else:
-            title_score = 0
-        scores['title'] = title_score
-
-        # Meta Description (15 points)
-        desc_length = onpage.get('meta_description_length', 0)
-
-        if 120 <= desc_length <= 160:
-            desc_score = 15
-        elif 100 <= desc_length <= 180:
-            desc_score = 10
-        elif desc_length > 0:
-            desc_score = 5
-        else:
-            desc_score = 0
-        scores['meta_description'] = desc_score
-
-        # Content Quality (20 points)
-        word_count = onpage.get('word_count', 0)
-
-        if word_count >= 1500:
-            content_score = 20
-        elif word_count >= 1000:
-            content_score = 16
-        elif word_count >= 500:
-            content_score = 12
-        elif word_count >= 300:
-            content_score = 8
-        else:
-            content_score = 4
-        scores['content'] = content_score
-
-        # Image Optimization (15 points)
-        images = onpage.get('images', {})
-        alt_percentage = images.get('alt_percentage', 0)
-
-        if alt_percentage >= 90:
-            image_score = 15
-        elif alt_percentage >= 70:
-            image_score = 12
-        elif alt_percentage >= 50:
-            image_score = 8
-        elif alt_percentage >= 30:
-            image_score = 5
-        else:
-            image_score = 2
-        scores['images'] = image_score
-
-        # Internal Linking (20 points)
-        internal_links = onpage.get('internal_links', {}).get('count', 0)
-
-        if internal_links >= 10:
-            internal_score = 20
-        elif internal_links >= 5:
-            internal_score = 15
-        elif internal_links >= 3:
-            internal_score = 10
-        elif internal_links >= 1:
-            internal_score = 5
-        else:
-            internal_score = 0
-        scores['internal_links'] = internal_score
-
-        # URL Structure (15 points)
-        url_struct = onpage.get('url_structure', {})
-        url_length = url_struct.get('length', 100)
-        uses_hyphens = url_struct.get('uses_hyphens', False)
-        path_depth = url_struct.get('path_depth', 5)
-
-        url_score = 15
-        if url_length > 100:
-            url_score -= 5
-        if not uses_hyphens and path_depth > 0:
-            url_score -= 3
-        if path_depth > 4:
-            url_score -= 4
-
-        scores['url_structure'] = max(0, url_score)
-
-        self.breakdown['onpage'] = scores
-        return sum(scores.values())
+        return _score_onpage(self._on, self._title_length,
+                             self._desc_length, self.breakdown)
 
     def _score_competitive(self) -> int:
-        """Score Competitive Position (0-100)"""
-        competitors = self.audit_data.get('competitors', {})
-
-        if not competitors or 'error' in competitors:
-            # No competitive data available
-            return 50  # Neutral score
-
-        scores = {}
-
-        # Current SERP Position (40 points)
-        position = competitors.get('current_position')
-
-        if position:
-            if position == 1:
-                position_score = 40
-            elif position <= 3:
-                position_score = 35
-            elif position <= 5:
-                position_score = 30
-            elif position <= 10:
-                position_score = 20
-            else:
-                position_score = 10
-        else:
-            position_score = 5  # Not ranking in top 10
-
-        scores['serp_position'] = position_score
-
-        # Competitive Meta Analysis (60 points)
-        top_competitors = competitors.get('top_competitors', [])
-
-        if top_competitors:
-            # Compare title length
-            avg_comp_title_length = sum(c.get('title_length', 0) for c in top_competitors) / len(top_competitors)
-            current_title_length = self.audit_data.get('onpage', {}).get('title_length', 0)
-
-            if 30 <= current_title_length <= 60 and abs(current_title_length - avg_comp_title_length) < 20:
-                title_comp_score = 30
-            elif current_title_length > 0:
-                title_comp_score = 20
-            else:
-                title_comp_score = 5
-
-            scores['title_competitiveness'] = title_comp_score
-
-            # Compare description length
-            avg_comp_desc_length = sum(c.get('description_length', 0) for c in top_competitors) / len(top_competitors)
-            current_desc_length = self.audit_data.get('onpage', {}).get('meta_description_length', 0)
-
-            if 120 <= current_desc_length <= 160 and abs(current_desc_length - avg_comp_desc_length) < 30:
-                desc_comp_score = 30
-            elif current_desc_length > 0:
-                desc_comp_score = 20
-            else:
-                desc_comp_score = 5
-
-            scores['description_competitiveness'] = desc_comp_score
-        else:
-            scores['title_competitiveness'] = 25
-            scores['description_competitiveness'] = 25
-
-        self.breakdown['competitive'] = scores
-        return sum(scores.values())
+        return _score_competitive(self._comp, self._title_length,
+                                  self._desc_length, self.breakdown)
 
     def _get_grade(self, score: int) -> str:
-        """Convert score to letter grade"""
-        if score >= 90:
-            return 'A'
-        elif score >= 80:
-            return 'B'
-        elif score >= 70:
-            return 'C'
-        elif score >= 60:
-            return 'D'
-        else:
-            return 'F'
+        return _get_grade(score)
 
     def _generate_recommendations(self, technical_score: int, onpage_score: int, competitive_score: int) -> List[Dict[str, str]]:
-        """Generate prioritized recommendations based on scores"""
-        recommendations = []
-
-        # Technical recommendations
-        technical = self.audit_data.get('technical', {})
-        performance = self.audit_data.get('performance', {})
-
-        if not technical.get('https', False):
-            recommendations.append({
-                'priority': 'critical',
-                'category': 'Technical',
-                'issue': 'No HTTPS/SSL Certificate',
-                'recommendation': 'Install an SSL certificate to enable HTTPS. This is critical for security and SEO.',
-            })
-
-        if not technical.get('mobile_responsive', False):
-            recommendations.append({
-                'priority': 'critical',
-                'category': 'Technical',
-                'issue': 'Not Mobile Responsive',
-                'recommendation': 'Implement responsive design with proper viewport meta tag. Mobile-first indexing requires mobile optimization.',
-            })
-
-        if performance.get('load_time_ms', 0) > 3000:
-            recommendations.append({
-                'priority': 'high',
-                'category': 'Performance',
-                'issue': f"Slow Page Load ({performance.get('load_time_ms', 0)}ms)",
-                'recommendation': 'Optimize images, enable caching, minimize CSS/JS, and use a CDN to improve load times.',
-            })
-
-        if not technical.get('sitemap_exists', False):
-            recommendations.append({
-                'priority': 'high',
-                'category': 'Technical',
-                'issue': 'No XML Sitemap',
-                'recommendation': 'Create and submit an XML sitemap to help search engines discover your pages.',
-            })
-
-        # On-page recommendations
-        onpage = self.audit_data.get('onpage', {})
-
-        title_length = onpage.get('title_length', 0)
-        if title_length == 0:
-            recommendations.append({
-                'priority': 'critical',
-                'category': 'On-Page',
-                'issue': 'Missing Title Tag',
-                'recommendation': 'Add a unique, descriptive title tag (30-60 characters) to every page.',
-            })
-        elif title_length < 30 or title_length > 60:
-            recommendations.append({
-                'priority': 'medium',
-                'category': 'On-Page',
-                'issue': f"Title Tag Length ({title_length} chars)",
-                'recommendation': 'Optimize title tag length to 30-60 characters for better SERP display.',
-            })
-
-        desc_length = onpage.get('meta_description_length', 0)
-        if desc_length == 0:
-            recommendations.append({
-                'priority': 'high',
-                'category': 'On-Page',
-                'issue': 'Missing Meta Description',
-                'recommendation': 'Add a compelling meta description (120-160 characters) to improve click-through rates.',
-            })
-
-        images = onpage.get('images', {})
-        if images.get('images_without_alt', 0) > 0:
-            recommendations.append({
-                'priority': 'medium',
-                'category': 'On-Page',
-                'issue': f"{images.get('images_without_alt')} Images Missing Alt Text",
-                'recommendation': 'Add descriptive alt text to all images for accessibility and SEO.',
-            })
-
-        word_count = onpage.get('word_count', 0)
-        if word_count < 300:
-            recommendations.append({
-                'priority': 'high',
-                'category': 'Content',
-                'issue': f"Thin Content ({word_count} words)",
-                'recommendation': 'Add more high-quality, relevant content. Aim for at least 500-1000 words for better rankings.',
-            })
-
-        # Competitive recommendations
-        competitors = self.audit_data.get('competitors', {})
-        if competitors and not competitors.get('error'):
-            position = competitors.get('current_position')
-            if not position:
-                recommendations.append({
-                    'priority': 'medium',
-                    'category': 'Competitive',
-                    'issue': 'Not Ranking in Top 10',
-                    'recommendation': f"Target keyword '{competitors.get('keyword')}' - Analyze top-ranking competitors and improve content quality.",
-                })
-
-        # Sort by priority
-        priority_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-        recommendations.sort(key=lambda x: priority_order.get(x['priority'], 3))
-
-        return recommendations[:10]  # Return top 10 recommendations
+        return _generate_recommendations(self._tech, self._perf, self._on,
+                                         self._comp, self._title_length,
+                                         self._desc_length)
+
+
+# Fixed-width score-affecting fields, in fingerprint order
+_FP_PACK = struct.Struct('<7?iiqdd3id4i?i?i').pack
+
+
+def _score_input_fingerprint(audit_data: Dict[str, Any]) -> bytes:
+    """16-byte digest of every field the score depends on
+
+    Packs the numeric/boolean inputs with struct and appends the
+    variable-length parts (keyword, per-competitor lengths), then
+    hashes with blake2b. Equal digests mean equal score output.
+    """
+    technical = audit_data.get('technical') or {}
+    performance = audit_data.get('performance') or {}
+    onpage = audit_data.get('onpage') or {}
+    competitors = audit_data.get('competitors') or {}
+    headings = technical.get('headings') or {}
+    url_struct = onpage.get('url_structure') or {}
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_FP_PACK(
+        bool(technical.get('https')),
+        bool(technical.get('mobile_responsive')),
+        bool(technical.get('robots_txt_exists')),
+        bool(technical.get('sitemap_exists')),
+        bool(technical.get('canonical')),
+        bool((technical.get('schema_markup') or {}).get('has_schema')),
+        bool(headings.get('has_proper_hierarchy')),
+        headings.get('h1_count', 0),
+        (technical.get('broken_links') or {}).get('broken_count', 0),
+        # -1 sentinel: scoring and recommendations default this
+        # differently, so absence must not collide with a real value
+        performance.get('load_time_ms', -1),
+        performance.get('lcp', 5000),
+        performance.get('cls', 1),
+        onpage.get('title_length', 0),
+        onpage.get('meta_description_length', 0),
+        onpage.get('word_count', 0),
+        (onpage.get('images') or {}).get('alt_percentage', 0),
+        (onpage.get('images') or {}).get('images_without_alt', 0),
+        (onpage.get('internal_links') or {}).get('count', 0),
+        url_struct.get('length', 100),
+        url_struct.get('path_depth', 5),
+        bool(url_struct.get('uses_hyphens')),
+        competitors.get('current_position') or 0,
+        'error' in competitors,
+        len(competitors),
+    ))
+    h.update(str(competitors.get('keyword', '')).encode())
+    for c in competitors.get('top_competitors') or ():
+        h.update(struct.pack('<ii', c.get('title_length', 0),
+                             c.get('description_length', 0)))
+    return h.digest()
+
+
+# Bounded LRU of digest -> score result; audits of identical pages
+# (retries, re-sent reports) skip the whole scoring pass
+_SCORE_CACHE: 'OrderedDict[bytes, Dict[str, Any]]' = OrderedDict()
+_SCORE_CACHE_MAX = 512
 
 
 def calculate_seo_score(audit_data: Dict[str, Any]) -> Dict[str, Any]:
     """Convenience function to calculate score"""
-    scorer = SEOScorer(audit_data)
-    return scorer.calculate_score()
+    digest = _score_input_fingerprint(audit_data)
+    cached = _SCORE_CACHE.get(digest)
+    if cached is not None:
+        _SCORE_CACHE.move_to_end(digest)
+        return cached
+    result = SEOScorer(audit_data).calculate_score()
+    _SCORE_CACHE[digest] = result
+    if len(_SCORE_CACHE) > _SCORE_CACHE_MAX:
+        _SCORE_CACHE.popitem(last=False)
+    return result
+
+
+def calculate_seo_scores_batch(audits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convenience function to score many audits in one compiled pass"""
+    return SEOScorer.from_batch(audits)
@@ -0,0 +1,150 @@
+"""
+Numba batch-scoring kernels
+
+Compiled counterparts of the technical and on-page ladders in
+scoring.py, operating on structure-of-arrays inputs so a bulk audit run
+scores every page in one parallel pass. Keep the branch logic here in
+sync with the tables in scoring.py.
+"""
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True)
+def _score_technical_vec(https, mobile, robots, sitemap, schema,
+                         h1_count, hierarchy, canonical,
+                         load_time, lcp, cls, broken_count):
+    """Technical subscore (0-100) for each audit in the batch"""
+    n = https.shape[0]
+    out = np.empty(n, dtype=np.int32)
+
+    for i in prange(n):
+        score = 0
+        if https[i]:
+            score += 5
+        if mobile[i]:
+            score += 10
+        if robots[i]:
+            score += 5
+        if sitemap[i]:
+            score += 5
+        if schema[i]:
+            score += 5
+
+        if hierarchy[i]:
+            score += 10
+        elif h1_count[i] > 0:
+            score += 5
+
+        if canonical[i]:
+            score += 5
+
+        lt = load_time[i]
+        if lt < 2000:
+            score += 25
+        elif lt < 3000:
+            score += 20
+        elif lt < 5000:
+            score += 15
+        elif lt < 7000:
+            score += 10
+        else:
+            score += 5
+
+        l = lcp[i]
+        if l < 2500:
+            score += 8
+        elif l < 4000:
+            score += 5
+        else:
+            score += 2
+
+        c = cls[i]
+        if c < 0.1:
+            score += 7
+        elif c < 0.25:
+            score += 4
+        else:
+            score += 1
+
+        penalty = 15 - broken_count[i] * 3
+        score += penalty if penalty > 0 else 0
+
+        out[i] = score
+
+    return out
+
+
+@njit(cache=True, parallel=True)
+def _score_onpage_vec(title_length, desc_length, word_count,
+                      alt_percentage, internal_links,
+                      url_length, uses_hyphens, path_depth):
+    """On-page subscore (0-100) for each audit in the batch"""
+    n = title_length.shape[0]
+    out = np.empty(n, dtype=np.int32)
+
+    for i in prange(n):
+        score = 0
+
+        tl = title_length[i]
+        if 30 <= tl <= 60:
+            score += 15
+        elif 20 <= tl <= 70:
+            score += 10
+        elif tl > 0:
+            score += 5
+
+        dl = desc_length[i]
+        if 120 <= dl <= 160:
+            score += 15
+        elif 100 <= dl <= 180:
+            score += 10
+        elif dl > 0:
+            score += 5
+
+        wc = word_count[i]
+        if wc >= 1500:
+            score += 20
+        elif wc >= 1000:
+            score += 16
+        elif wc >= 500:
+            score += 12
+        elif wc >= 300:
+            score += 8
+        else:
+            score += 4
+
+        alt = alt_percentage[i]
+        if alt >= 90:
+            score += 15
+        elif alt >= 70:
+            score += 12
+        elif alt >= 50:
+            score += 8
+        elif alt >= 30:
+            score += 5
+        else:
+            score += 2
+
+        links = internal_links[i]
+        if links >= 10:
+            score += 20
+        elif links >= 5:
+            score += 15
+        elif links >= 3:
+            score += 10
+        elif links >= 1:
+            score += 5
+
+        url_score = 15
+        if url_length[i] > 100:
+            url_score -= 5
+        if not uses_hyphens[i] and path_depth[i] > 0:
+            url_score -= 3
+        if path_depth[i] > 4:
+            url_score -= 4
+        score += url_score if url_score > 0 else 0
+
+        out[i] = score
+
+    return out
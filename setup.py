@@ -0,0 +1,19 @@
+"""
+Optional ahead-of-time build for the scoring hot path
+
+Compiles scoring.py to a C extension with mypyc. The app does not
+require this: Python imports the compiled module automatically when it
+exists and falls back to the plain source otherwise.
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+scoring_numba.py is excluded - numba JIT-compiles it at runtime.
+"""
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name='seo-audit-scoring',
+    ext_modules=mypycify(['scoring.py']),
+)